@@ -7,20 +7,37 @@
 import sys
 import os
 import json
-import shutil
-import traceback
+import functools
+import types
 import threading
-from datetime import datetime, timedelta
+import queue
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
 
 import numpy as np
 import sounddevice as sd
-from scipy.io import wavfile
-import whisper
 import qtawesome as qta
 
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer, Qt, QDate, QDateTime, QTime, QEvent, QSettings, QPropertyAnimation, QEasingCurve
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QTimeEdit, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QStackedWidget, QTableWidget, QTableWidgetItem, QDialog, QFormLayout, QLineEdit, QDateTimeEdit, QTextEdit, QMessageBox, QCheckBox, QDialogButtonBox, QAbstractItemView, QSizePolicy, QHeaderView, QButtonGroup, QMenu, QDesktopWidget, QComboBox, QShortcut, QDateEdit, QCompleter)
-from PyQt5.QtGui import QFont, QIcon, QColor, QCursor, QKeySequence, QPainter
+# torch, whisper and faster-whisper take seconds to import, so they are bound
+# by load_speech_backend() on first use (normally the warm-up thread), not here
+torch = None
+whisper = None
+WhisperModel = None
+
+try:
+    # Optional C++ fuzzy matcher; lets name autocomplete tolerate typos
+    from rapidfuzz import fuzz as rapidfuzz_fuzz, process as rapidfuzz_process
+except ImportError:
+    rapidfuzz_fuzz = rapidfuzz_process = None
+try:
+    # Optional C ISO-8601 parser; handles the API's 'Z' suffix without a string copy
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = None
+
+from PyQt5.QtCore import QThread, pyqtSignal, QTimer, Qt, QDate, QDateTime, QTime, QEvent, QSettings, QPropertyAnimation, QEasingCurve, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QTimeEdit, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QStackedWidget, QTableView, QDialog, QFormLayout, QLineEdit, QDateTimeEdit, QTextEdit, QMessageBox, QCheckBox, QDialogButtonBox, QAbstractItemView, QSizePolicy, QHeaderView, QButtonGroup, QMenu, QDesktopWidget, QComboBox, QShortcut, QDateEdit, QCompleter, QSplashScreen)
+from PyQt5.QtGui import QFont, QIcon, QColor, QBrush, QCursor, QKeySequence, QPainter, QPixmapCache, QPixmap
 from PyQt5.QtCore import QStringListModel
 from PyQt5.QtGui import QMovie
 
@@ -29,6 +46,8 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 
 import logging
 from logging.handlers import RotatingFileHandler
@@ -240,6 +259,20 @@ class TokenManager:
 # Global token manager instance
 token_manager = TokenManager()
 
+# Calendar API client for the current access token, reused across logins
+_SERVICE_CACHE = {}
+
+def get_calendar_service(credentials):
+    """Get a Calendar API client for the credentials, building it only when the token changes."""
+    key = credentials.token
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        # Use the discovery document bundled with the client library instead of fetching it
+        service = build('calendar', 'v3', credentials=credentials, cache_discovery=False, static_discovery=True)
+        _SERVICE_CACHE.clear()
+        _SERVICE_CACHE[key] = service
+    return service
+
 # -----------------------------
 # Name Persistence Manager
 # -----------------------------
@@ -252,6 +285,11 @@ class NamePersistenceManager:
     def __init__(self, filename='saved_names.txt'):
         self.filename = filename
         self.names = set()
+        self._appended = False  # Names appended since the file was last rewritten sorted
+        self._sorted_cache = None  # sorted(self.names), rebuilt after the set changes
+        self._lower_cache = None  # (lowercased, original) pairs in sorted order for searching
+        self._trigrams = None  # Lowercase trigram -> indices into _lower_cache of names containing it
+        self._fuzzy_choices = None  # Lowercase names alone, in _lower_cache order, for rapidfuzz
         self.load_names()
     
     def load_names(self):
@@ -259,67 +297,385 @@ class NamePersistenceManager:
         try:
             if os.path.exists(self.filename):
                 with open(self.filename, 'r', encoding='utf-8') as f:
-                    names = f.read().strip().split('\n')
-                    self.names = {name.strip() for name in names if name.strip()}
+                    # Stream the lines; strip() also drops the trailing newline
+                    self.names = {name for name in (line.strip() for line in f) if name}
+                self._invalidate_caches()
                 logger.info(f"Loaded {len(self.names)} saved names from {self.filename}")
         except Exception as e:
             logger.error(f"Error loading names from {self.filename}: {e}")
             self.names = set()
+            self._invalidate_caches()
+    
+    def _invalidate_caches(self):
+        self._sorted_cache = None
+        self._lower_cache = None
+        self._trigrams = None
+        self._fuzzy_choices = None
+    
+    def _lowered(self):
+        """Names paired with their lowercase form, built once per change to the set."""
+        if self._lower_cache is None:
+            self._lower_cache = [(name.lower(), name) for name in self.get_names()]
+        return self._lower_cache
+    
+    def _choices(self):
+        """Lowercase names in _lowered() order, built once per change to the set."""
+        if self._fuzzy_choices is None:
+            self._fuzzy_choices = [name_lower for name_lower, _ in self._lowered()]
+        return self._fuzzy_choices
+    
+    def _trigram_index(self):
+        """Trigram posting lists over _lowered(), built once per change to the set."""
+        if self._trigrams is None:
+            index = {}
+            for i, (name_lower, _) in enumerate(self._lowered()):
+                for j in range(len(name_lower) - 2):
+                    index.setdefault(name_lower[j:j + 3], set()).add(i)
+            self._trigrams = index
+        return self._trigrams
     
     def save_names(self):
-        """Save names to the text file."""
+        """Save names to the text file, replacing it atomically."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                for name in sorted(self.names):
-                    f.write(f"{name}\n")
+            # Write a sibling temp file and swap it in, so a crash mid-write never leaves a truncated file
+            tmp_filename = self.filename + '.tmp'
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.writelines(f"{name}\n" for name in self.get_names())
+            os.replace(tmp_filename, self.filename)
             logger.info(f"Saved {len(self.names)} names to {self.filename}")
         except Exception as e:
             logger.error(f"Error saving names to {self.filename}: {e}")
     
+    def compact(self):
+        """Rewrite the file sorted if names were appended to it; called on app shutdown."""
+        if self._appended:
+            self.save_names()
+            self._appended = False
+    
     def add_name(self, name):
-        """Add a new name to the saved list."""
+        """Add a new name to the saved list, appending only that line to the file."""
         if name and name.strip():
             name = name.strip()
+            if name in self.names:
+                return
             self.names.add(name)
-            self.save_names()
+            self._invalidate_caches()
+            try:
+                with open(self.filename, 'a', encoding='utf-8') as f:
+                    f.write(f"{name}\n")
+                self._appended = True
+            except Exception as e:
+                logger.error(f"Error saving name to {self.filename}: {e}")
             logger.info(f"Added name: {name}")
     
     def get_names(self):
         """Get all saved names as a sorted list."""
-        return sorted(list(self.names))
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self.names)
+        return list(self._sorted_cache)
     
     def get_names_starting_with(self, prefix):
         """Get names that start with the given prefix."""
         prefix = prefix.lower()
-        return [name for name in self.names if name.lower().startswith(prefix)]
+        return [name for lower, name in self._lowered() if lower.startswith(prefix)]
     
     def get_recent_names(self, count=3):
         """Get the most recent names (last added)."""
         return list(self.names)[-count:] if self.names else []
     
     def fuzzy_search(self, query, max_results=10):
-        """Fuzzy search for names containing the query anywhere."""
+        """
+        Search for names containing the query anywhere, names starting with it first.
+        With rapidfuzz installed, close misspellings fill any remaining slots.
+        """
         if not query:
             return []
         
         query = query.lower()
-        results = []
+        starts = []
+        contains = []
+        pairs = self._lowered()
+        candidates = pairs
+        if len(query) >= 3:
+            # Only names sharing every trigram of the query can contain it
+            index = self._trigram_index()
+            postings = [index.get(query[i:i + 3]) for i in range(len(query) - 2)]
+            if all(postings):
+                postings.sort(key=len)
+                candidates = [pairs[i] for i in sorted(set.intersection(*postings))]
+            else:
+                candidates = []
         
-        for name in self.names:
-            name_lower = name.lower()
+        for name_lower, name in candidates:
             # Check if query is contained anywhere in the name
             if query in name_lower:
                 # Prioritize names that start with the query
                 if name_lower.startswith(query):
-                    results.insert(0, name)  # Add to beginning for priority
+                    starts.append(name)
+                    if len(starts) >= max_results:
+                        break
                 else:
+                    contains.append(name)
+        
+        results = (starts + contains)[:max_results]
+        # Below three characters WRatio at this cutoff matches mostly noise
+        if rapidfuzz_process is not None and len(query) >= 3 and len(results) < max_results:
+            found = set(results)
+            matches = rapidfuzz_process.extract(query, self._choices(),
+                                                scorer=rapidfuzz_fuzz.WRatio, limit=max_results,
+                                                score_cutoff=60)
+            for _, _, index in matches:
+                name = pairs[index][1]
+                if name not in found:
                     results.append(name)
-        
-        return results[:max_results]
+                    found.add(name)
+                    if len(results) >= max_results:
+                        break
+        return results
 
 # Global name persistence manager instance
 name_manager = NamePersistenceManager()
 
+# -----------------------------
+# Whisper Model Cache
+# -----------------------------
+# Loaded models keyed by (backend, model_name, device, compute_type), shared by all WhisperWorkers
+_MODEL_CACHE = {}
+_MODEL_LOCK = threading.Lock()
+
+# Model sizes that ship an English-only ".en" variant
+ENGLISH_ONLY_SIZES = ("tiny", "base", "small", "medium")
+
+_SPEECH_BACKEND_LOCK = threading.Lock()
+_speech_backend_loaded = False
+
+def load_speech_backend():
+    """Import torch, whisper and (optionally) faster-whisper once; safe to call from any thread."""
+    global torch, whisper, WhisperModel, _speech_backend_loaded
+    if _speech_backend_loaded:
+        return
+    with _SPEECH_BACKEND_LOCK:
+        if _speech_backend_loaded:
+            return
+        try:
+            import torch as torch_module
+            # Leave a core for the GUI thread so CPU decoding doesn't starve the event loop
+            torch_module.set_num_threads(max(1, (os.cpu_count() or 2) - 1))
+            torch = torch_module
+        except ImportError:
+            logger.warning("[WhisperWorker] PyTorch not installed")
+        import whisper as whisper_module
+        whisper = whisper_module
+        try:
+            # Optional CTranslate2 backend; preferred over openai-whisper when installed
+            from faster_whisper import WhisperModel as whisper_model_class
+            WhisperModel = whisper_model_class
+        except ImportError:
+            pass
+        _speech_backend_loaded = True
+
+@functools.lru_cache(maxsize=1)
+def cuda_available():
+    """torch.cuda.is_available(), probed once per process (the first call initialises the driver)."""
+    try:
+        load_speech_backend()
+        return torch is not None and torch.cuda.is_available()
+    except Exception:
+        return False
+
+def preferred_device():
+    """Return 'cuda' when a usable GPU is present, otherwise 'cpu'."""
+    return 'cuda' if cuda_available() else 'cpu'
+
+def whisper_model_name(base_model, language):
+    """Get the model to load, preferring the English-only variant for English."""
+    if base_model is None:
+        # tiny.en holds up for short English snippets; multilingual tiny is much weaker for Japanese
+        base_model = "tiny" if language == "en" else "base"
+    if language == "en" and base_model in ENGLISH_ONLY_SIZES:
+        return f"{base_model}.en"
+    return base_model
+
+# faster-whisper compute type per device, probed once
+_COMPUTE_TYPES = {}
+
+def get_compute_type(device):
+    """Pick the faster-whisper compute type for a device from its Tensor-core support."""
+    compute_type = _COMPUTE_TYPES.get(device)
+    if compute_type is not None:
+        return compute_type
+    compute_type = "int8"
+    if device == 'cuda':
+        try:
+            major, minor = torch.cuda.get_device_capability(0)
+            if major >= 8:
+                # Ampere and newer have bfloat16 Tensor cores
+                compute_type = "int8_bfloat16"
+            elif major >= 7:
+                compute_type = "int8_float16"
+            else:
+                # No Tensor cores: mixed int8 kernels are slow or unsupported, stay in float16
+                compute_type = "float16"
+            logger.info("[WhisperWorker] GPU compute capability %d.%d, using compute type %s",
+                        major, minor, compute_type)
+        except Exception as e:
+            logger.warning("[WhisperWorker] GPU capability probe failed, using int8: %s", e)
+    _COMPUTE_TYPES[device] = compute_type
+    return compute_type
+
+def compile_encoder(model):
+    """Compile the encoder for single 30 s clips on CUDA, staying in eager mode if that fails."""
+    if model.device.type != 'cuda':
+        return model
+    eager_encoder = model.encoder
+    try:
+        # Default mode rather than reduce-overhead: CUDA graphs recorded on the warm-up thread
+        # are not safe to replay from the transcription thread
+        compiled_encoder = torch.compile(eager_encoder, dynamic=False, fullgraph=True)
+    except Exception as e:
+        logger.warning("[WhisperWorker] Encoder compilation failed, using eager mode: %s", e)
+        return model
+    
+    class GuardedEncoder(torch.nn.Module):
+        """Runs B=1 through the compiled encoder; batches run eagerly, and a compile error restores eager mode."""
+        def __init__(self):
+            super().__init__()
+            self.eager = eager_encoder
+        
+        def forward(self, mel):
+            if mel.shape[0] == 1:
+                try:
+                    return compiled_encoder(mel)
+                except Exception as e:
+                    model.encoder = eager_encoder
+                    logger.warning("[WhisperWorker] Compiled encoder failed, using eager mode: %s", e)
+            return eager_encoder(mel)
+    
+    model.encoder = GuardedEncoder()
+    # Compilation happens on the first call, so trigger it here with the decode input shape
+    with torch.inference_mode():
+        model.encoder(torch.zeros(1, model.dims.n_mels, whisper.audio.N_FRAMES,
+                                  device=model.device, dtype=torch.float16))
+    if model.encoder is not eager_encoder:
+        logger.info("[WhisperWorker] Compiled Whisper encoder")
+    return model
+
+def get_model(name, device):
+    """Return a cached Whisper model, loading it on first use."""
+    load_speech_backend()
+    if WhisperModel is not None:
+        compute_type = get_compute_type(device)
+        key = ('faster-whisper', name, device, compute_type)
+    else:
+        compute_type = None
+        key = ('whisper', name, device, compute_type)
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        with _MODEL_LOCK:
+            # Re-check under the lock in case another thread loaded it meanwhile
+            model = _MODEL_CACHE.get(key)
+            if model is None:
+                logger.info("[WhisperWorker] Loading %s model '%s' on %s", key[0], name, device)
+                if WhisperModel is not None:
+                    model = WhisperModel(name, device=device, compute_type=compute_type)
+                else:
+                    model = compile_encoder(whisper.load_model(name, device=device))
+                _MODEL_CACHE[key] = model
+    return model
+
+def transcribe_batch(model, audios, language):
+    """Transcribe a list of clips with whichever backend loaded the model and return their texts."""
+    if WhisperModel is not None and isinstance(model, WhisperModel):
+        texts = []
+        for audio in audios:
+            segments, _ = model.transcribe(audio, language=language, beam_size=1, vad_filter=True,
+                                           without_timestamps=True)
+            texts.append("".join(seg.text for seg in segments).strip())
+        return texts
+    # FP16 on CUDA; no timestamps since only the text is used, which skips the
+    # per-token timestamp rules and shortens the decoded sequence
+    options = whisper.DecodingOptions(language=language, fp16=(model.device.type == 'cuda'),
+                                      without_timestamps=True)
+    # inference_mode also skips the view/version-counter tracking that no_grad keeps
+    with torch.inference_mode():
+        # Build the log-mels on the model's device; whisper caches the mel filterbank per device.
+        # Every clip is padded to 30 s, so they stack into one (B, n_mels, 3000) encoder batch.
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(torch.from_numpy(audio).to(model.device)),
+                                        model.dims.n_mels)
+            for audio in audios
+        ])
+        results = whisper.decode(model, mel, options)
+    return [result.text.strip() for result in results]
+
+def transcribe_audio(model, audio, language):
+    """Transcribe a single clip and return the text."""
+    return transcribe_batch(model, [audio], language)[0]
+
+def warm_up_whisper(language="en", base_model=None):
+    """Load the model for the speech language and run one second of silence through it so the first voice press is fast."""
+    try:
+        device = preferred_device()
+        model = get_model(whisper_model_name(base_model, language), device)
+        transcribe_audio(model, np.zeros(16000, dtype=np.float32), None if language == 'auto' else language)
+        logger.info("[WhisperWorker] Warm-up complete on %s", device)
+    except Exception as e:
+        logger.warning("[WhisperWorker] Warm-up failed: %s", e)
+
+class TranscriptionService:
+    """
+    Runs all transcriptions on one background thread. Clips queued while a
+    transcription is running are decoded together in the next pass, so the
+    encoder cost is shared across them.
+    """
+    MAX_BATCH = 4  # Most clips passed through the encoder at once
+    
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def submit(self, model_name, device, audio, language):
+        """Queue a clip for transcription and return a Future for its text."""
+        future = Future()
+        self._queue.put((model_name, device, language, audio, future))
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return future
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Take whatever else is already waiting; no extra delay for a lone clip
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Only clips for the same model, device and language can share a pass
+            groups = {}
+            for model_name, device, language, audio, future in batch:
+                groups.setdefault((model_name, device, language), []).append((audio, future))
+            for (model_name, device, language), items in groups.items():
+                self._transcribe_group(model_name, device, language, items)
+    
+    def _transcribe_group(self, model_name, device, language, items):
+        try:
+            model = get_model(model_name, device)
+            if len(items) > 1:
+                logger.info("[WhisperWorker] Transcribing %d clips in one batch", len(items))
+            texts = transcribe_batch(model, [audio for audio, _ in items], language)
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+            return
+        for (_, future), text in zip(items, texts):
+            future.set_result(text)
+
+transcription_service = TranscriptionService()
+
 # -----------------------------
 # WhisperWorker: Handles audio recording and transcription
 # -----------------------------
@@ -332,25 +688,39 @@ class WhisperWorker(QThread):
     error = pyqtSignal(str)
     status = pyqtSignal(str)
     
-    def __init__(self, duration=5, parent=None):
+    # Voice activity gate used to stop recording once the speaker is done
+    FRAME_MS = 30  # Length of each analysed frame
+    SPEECH_RMS = 500  # int16 RMS level at or above which a frame counts as speech
+    TRAILING_SILENCE_MS = 800  # Stop after this much silence following speech
+    LEADING_SILENCE_MS = 3000  # Stop if nothing reaches SPEECH_RMS within this long
+    
+    def __init__(self, duration=10, base_model=None, parent=None):
         super().__init__(parent)
-        self.duration = duration  # Recording duration in seconds
+        self.duration = duration  # Maximum recording duration in seconds
+        self.base_model = base_model  # Whisper model size; None picks tiny for English, base otherwise
         self.sample_rate = 16000  # Whisper expects 16kHz
-        self.temp_file = os.path.join(os.path.expanduser("~"), ".seinxcal_temp_new.wav")
         self.language = "en"  # Default language
         
-        # Pre-import torch to check device availability
+        # Device detection loads the speech backend, so it waits for run() off the GUI thread
+        self.device = None  # None until detected; force_cpu() pins it to 'cpu'
+        self.torch_available = False
+    
+    def detect_device(self):
+        """Check torch/CUDA availability; cuda_available() also loads the speech backend."""
         try:
-            import torch
+            has_cuda = cuda_available()
+            if torch is None:
+                raise ImportError("torch")
             self.torch_available = True
-            cuda_available = torch.cuda.is_available()
-            self.device = 'cuda' if cuda_available else 'cpu'
-            logger.info(f"[WhisperWorker] Device detection: {self.device}")
-            logger.info(f"[WhisperWorker] Torch version: {torch.__version__}")
-            logger.info(f"[WhisperWorker] CUDA available: {cuda_available}")
-            if cuda_available:
-                logger.info(f"[WhisperWorker] CUDA device count: {torch.cuda.device_count()}")
-                logger.info(f"[WhisperWorker] CUDA device name: {torch.cuda.get_device_name(0) if torch.cuda.device_count() > 0 else 'None'}")
+            if self.device is None:
+                self.device = 'cuda' if has_cuda else 'cpu'
+            logger.info("[WhisperWorker] Device detection: %s", self.device)
+            logger.info("[WhisperWorker] Torch version: %s", torch.__version__)
+            logger.info("[WhisperWorker] CUDA available: %s", has_cuda)
+            # Device queries are only worth making when the record will be emitted
+            if has_cuda and logger.isEnabledFor(logging.INFO):
+                logger.info("[WhisperWorker] CUDA device count: %s", torch.cuda.device_count())
+                logger.info("[WhisperWorker] CUDA device name: %s", torch.cuda.get_device_name(0) if torch.cuda.device_count() > 0 else 'None')
         except ImportError:
             self.torch_available = False
             self.device = 'cpu'
@@ -358,24 +728,27 @@ class WhisperWorker(QThread):
         except Exception as e:
             self.torch_available = False
             self.device = 'cpu'
-            logger.error(f"[WhisperWorker] Error during device detection: {e}")
+            logger.error("[WhisperWorker] Error during device detection: %s", e)
             logger.warning("[WhisperWorker] Using CPU fallback due to detection error")
     
     def set_language(self, lang):
         """Set the language for transcription."""
         self.language = lang
     
+    def get_model_name(self):
+        """Get the model to load, preferring the English-only variant for English."""
+        return whisper_model_name(self.base_model, self.language)
+    
     def get_device_info(self):
         """Get detailed device information for debugging."""
         try:
-            import torch
             info = {
                 'torch_version': torch.__version__,
-                'cuda_available': torch.cuda.is_available(),
+                'cuda_available': cuda_available(),
                 'device': self.device,
                 'torch_available': self.torch_available
             }
-            if torch.cuda.is_available():
+            if cuda_available():
                 info['cuda_device_count'] = torch.cuda.device_count()
                 info['cuda_device_name'] = torch.cuda.get_device_name(0) if torch.cuda.device_count() > 0 else 'None'
             return info
@@ -387,15 +760,44 @@ class WhisperWorker(QThread):
         self.device = 'cpu'
         logger.info("[WhisperWorker] Forced CPU usage")
     
+    def record_until_silence(self):
+        """
+        Record until the speaker goes quiet, nobody speaks within LEADING_SILENCE_MS, or the
+        duration cap is hit. Returns the speech as int16, or the whole take if the gate never opened.
+        """
+        frame_len = self.sample_rate * self.FRAME_MS // 1000
+        max_frames = int(self.duration * 1000) // self.FRAME_MS
+        silence_frames = self.TRAILING_SILENCE_MS // self.FRAME_MS
+        leading_frames = self.LEADING_SILENCE_MS // self.FRAME_MS
+        # Frames are written straight into one buffer sized for the duration cap
+        buffer = np.empty(max_frames * frame_len, dtype=np.int16)
+        recorded = 0
+        first_speech = last_speech = None
+        with sd.InputStream(samplerate=self.sample_rate, channels=1, dtype='int16', blocksize=frame_len) as stream:
+            for i in range(max_frames):
+                frame = buffer[i * frame_len:(i + 1) * frame_len]
+                frame[:] = stream.read(frame_len)[0][:, 0]
+                recorded = i + 1
+                rms = np.sqrt(np.mean(np.square(frame, dtype=np.float32)))
+                if rms >= self.SPEECH_RMS:
+                    if first_speech is None:
+                        first_speech = i
+                    last_speech = i
+                elif last_speech is not None and i - last_speech >= silence_frames:
+                    break
+                elif last_speech is None and recorded >= leading_frames:
+                    break
+        if first_speech is None:
+            # The gate never opened: either silence or a quiet microphone, so let Whisper decide
+            return buffer[:recorded * frame_len]
+        # Trim leading/trailing silence, keeping one frame of padding either side
+        start = max(0, first_speech - 1) * frame_len
+        end = min(recorded, last_speech + 2) * frame_len
+        return buffer[start:end]
+    
     def run(self):
         try:
-            # Check for ffmpeg
-            logger.info(f"[WhisperWorker] Checking ffmpeg: {shutil.which('ffmpeg')}")
-            if shutil.which("ffmpeg") is None:
-                self.error.emit("ffmpeg is not installed or not in your PATH. Please install ffmpeg and try again.")
-                logger.error("ffmpeg not found in PATH.")
-                return
-            
+            self.detect_device()
             # Check torch availability
             if not self.torch_available:
                 self.error.emit("PyTorch is not available. Please install torch and try again.")
@@ -404,31 +806,31 @@ class WhisperWorker(QThread):
             
             self.status.emit("Recording audio...")
             try:
-                # Record audio from microphone
-                logger.info(f"[WhisperWorker] Recording to temp file: {self.temp_file}")
-                recording = sd.rec(int(self.duration * self.sample_rate), samplerate=self.sample_rate, channels=1, dtype='int16')
-                sd.wait()
-                wavfile.write(self.temp_file, self.sample_rate, recording)
-                logger.info(f"[WhisperWorker] Temp file exists after recording: {os.path.exists(self.temp_file)}")
+                # Record audio from microphone, stopping once the speaker goes quiet
+                recording = self.record_until_silence()
+                # Whisper takes 16kHz mono float32 in [-1, 1] directly, no WAV/ffmpeg round-trip.
+                # Convert and scale in one pass into a single float32 array
+                audio = np.multiply(recording, np.float32(1.0 / 32768.0), dtype=np.float32)
+                logger.info("[WhisperWorker] Recorded %d samples", audio.shape[0])
             except Exception as e:
-                logger.error(f"[WhisperWorker] Audio recording failed: {e}\n{traceback.format_exc()}")
+                logger.error("[WhisperWorker] Audio recording failed: %s", e, exc_info=True)
                 self.error.emit(f"Audio recording failed: {e}")
                 return
             
+            if audio.size == 0:
+                self.error.emit("No speech detected. Please try again.")
+                return
+            
             self.status.emit("Transcribing...")
             try:
-                # Import torch and whisper here to ensure they're available
-                import torch
-                import whisper
-                
                 # Transcribe using Whisper with proper device selection
-                logger.info(f"[WhisperWorker] Checking temp file before transcription: {self.temp_file}, exists: {os.path.exists(self.temp_file)}")
-                logger.info(f"[WhisperWorker] Using device: {self.device}")
+                logger.info("[WhisperWorker] Using device: %s", self.device)
                 
-                # Load model with explicit device specification
-                model = whisper.load_model("base", device=self.device)
-                result = model.transcribe(self.temp_file, language=self.language)
-                text = result.get("text", "").strip()
+                # Hand the clip to the shared service, which batches it with any other pending clips
+                model_name = self.get_model_name()
+                # Whisper and faster-whisper both take None, not 'auto', to detect the language
+                language = None if self.language == 'auto' else self.language
+                text = transcription_service.submit(model_name, self.device, audio, language).result()
                 
                 if not text:
                     self.error.emit("No speech detected. Please try again.")
@@ -436,53 +838,104 @@ class WhisperWorker(QThread):
                     self.finished.emit(text)
                     
             except Exception as e:
-                logger.error(f"[WhisperWorker] Transcription failed: {e}\n{traceback.format_exc()}")
+                logger.error("[WhisperWorker] Transcription failed: %s", e, exc_info=True)
                 # If CUDA fails, try CPU fallback
                 if "cuda" in str(e).lower() and self.device == 'cuda':
                     logger.info("[WhisperWorker] CUDA failed, trying CPU fallback...")
                     self.status.emit("GPU failed, trying CPU...")
                     try:
-                        import whisper
-                        model = whisper.load_model("base", device='cpu')
-                        result = model.transcribe(self.temp_file, language=self.language)
-                        text = result.get("text", "").strip()
+                        model = get_model(model_name, 'cpu')
+                        text = transcribe_audio(model, audio, language)
                         if text:
                             logger.info("[WhisperWorker] CPU fallback successful")
                             self.finished.emit(text)
                         else:
                             self.error.emit("No speech detected. Please try again.")
                     except Exception as cpu_error:
-                        logger.error(f"[WhisperWorker] CPU fallback also failed: {cpu_error}")
+                        logger.error("[WhisperWorker] CPU fallback also failed: %s", cpu_error)
                         self.error.emit(f"Transcription failed on both GPU and CPU: {str(e)}")
                 elif "out of memory" in str(e).lower() and self.device == 'cuda':
                     logger.info("[WhisperWorker] CUDA out of memory, trying CPU fallback...")
                     self.status.emit("GPU memory full, trying CPU...")
                     try:
-                        import whisper
-                        model = whisper.load_model("base", device='cpu')
-                        result = model.transcribe(self.temp_file, language=self.language)
-                        text = result.get("text", "").strip()
+                        model = get_model(model_name, 'cpu')
+                        text = transcribe_audio(model, audio, language)
                         if text:
                             logger.info("[WhisperWorker] CPU fallback successful after OOM")
                             self.finished.emit(text)
                         else:
                             self.error.emit("No speech detected. Please try again.")
                     except Exception as cpu_error:
-                        logger.error(f"[WhisperWorker] CPU fallback also failed after OOM: {cpu_error}")
+                        logger.error("[WhisperWorker] CPU fallback also failed after OOM: %s", cpu_error)
                         self.error.emit(f"Transcription failed on both GPU and CPU: {str(e)}")
                 else:
                     self.error.emit(f"Transcription failed: {e}")
-            finally:
-                # Always clean up temp file
-                if os.path.exists(self.temp_file):
-                    try:
-                        os.remove(self.temp_file)
-                    except Exception as cleanup_err:
-                        logger.warning(f"Failed to remove temp file: {cleanup_err}")
         except Exception as e:
-            logger.error(f"[WhisperWorker] Unexpected error: {e}\n{traceback.format_exc()}")
+            logger.error("[WhisperWorker] Unexpected error: %s", e, exc_info=True)
             self.error.emit(str(e))
 
+# -----------------------------
+# Pixmap cache helper
+# -----------------------------
+def cached_pixmap(key, factory):
+    """Get a pixmap from the application-wide QPixmapCache, rendering it with factory() on a miss."""
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = factory()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+# -----------------------------
+# Input stylesheets, shared by every SpeechToTextWidget and AddEventDialog
+# -----------------------------
+MIC_BUTTON_DARK_QSS = """
+    QPushButton {
+        border: 1px solid #555;
+        border-radius: 4px;
+        background-color: #2c313a;
+        padding: 2px;
+    }
+    QPushButton:hover {
+        background-color: #3c414a;
+    }
+    QPushButton:pressed {
+        background-color: #1c212a;
+    }
+"""
+MIC_BUTTON_LIGHT_QSS = """
+    QPushButton {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background-color: #f8f9fa;
+        padding: 2px;
+    }
+    QPushButton:hover {
+        background-color: #e9ecef;
+    }
+    QPushButton:pressed {
+        background-color: #dee2e6;
+    }
+"""
+LINE_EDIT_DARK_QSS = """
+    QLineEdit {
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 5px;
+        background-color: #2c313a;
+        color: white;
+        min-height: 20px;
+    }
+"""
+LINE_EDIT_LIGHT_QSS = """
+    QLineEdit {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 5px;
+        background-color: white;
+        min-height: 20px;
+    }
+"""
+
 # -----------------------------
 # SpeechToTextWidget: UI for voice input
 # -----------------------------
@@ -492,6 +945,16 @@ class SpeechToTextWidget(QWidget):
     Emits textCaptured when transcription is complete.
     """
     textCaptured = pyqtSignal(str)
+    _MIC_ICONS = {}  # Microphone icon per colour, shared by all instances
+    
+    @classmethod
+    def mic_icon(cls, color):
+        """Get the microphone icon for a colour, building it once."""
+        icon = cls._MIC_ICONS.get(color)
+        if icon is None:
+            icon = cls._MIC_ICONS[color] = qta.icon('fa5s.microphone', color=color)
+        return icon
+    
     def __init__(self, parent=None, target_field=None):
         super().__init__(parent)
         self.target_field = target_field
@@ -502,48 +965,19 @@ class SpeechToTextWidget(QWidget):
         self.mic_button = QPushButton()
         self.mic_button.setFixedSize(30, 30)  # Make it square
         if AppSettings.theme == 'dark':
-            self.mic_button.setIcon(qta.icon('fa5s.microphone', color='white'))
+            self.mic_button.setIcon(self.mic_icon('white'))
         else:
-            self.mic_button.setIcon(qta.icon('fa5s.microphone', color='black'))
+            self.mic_button.setIcon(self.mic_icon('black'))
         self.mic_button.setToolTip("Click to use voice input for this field")
         self.mic_button.clicked.connect(self.start_listening)
         
         # Style the button to be square and compact
-        if AppSettings.theme == 'dark':
-            self.mic_button.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    background-color: #2c313a;
-                    padding: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #3c414a;
-                }
-                QPushButton:pressed {
-                    background-color: #1c212a;
-                }
-            """)
-        else:
-            self.mic_button.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                    background-color: #f8f9fa;
-                    padding: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #e9ecef;
-                }
-                QPushButton:pressed {
-                    background-color: #dee2e6;
-                }
-            """)
+        self.mic_button.setStyleSheet(MIC_BUTTON_DARK_QSS if AppSettings.theme == 'dark' else MIC_BUTTON_LIGHT_QSS)
         
         layout.addWidget(self.mic_button)
         self.setLayout(layout)
         self.worker = None
-        self.language = "en"
+        self.language = QSettings("SEINX", "Calendar").value("speech_language", "en")
         self.auto_submit = False  # Default to manual submit
         # Use ListeningOverlay as a spinner overlay
         self.overlay = ListeningOverlay(self)
@@ -628,37 +1062,11 @@ class SpeechToTextWidget(QWidget):
     def update_theme(self):
         """Update button styling when theme changes."""
         if AppSettings.theme == 'dark':
-            self.mic_button.setIcon(qta.icon('fa5s.microphone', color='white'))
-            self.mic_button.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    background-color: #2c313a;
-                    padding: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #3c414a;
-                }
-                QPushButton:pressed {
-                    background-color: #1c212a;
-                }
-            """)
+            self.mic_button.setIcon(self.mic_icon('white'))
+            self.mic_button.setStyleSheet(MIC_BUTTON_DARK_QSS)
         else:
-            self.mic_button.setIcon(qta.icon('fa5s.microphone', color='black'))
-            self.mic_button.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                    background-color: #f8f9fa;
-                    padding: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #e9ecef;
-                }
-                QPushButton:pressed {
-                    background-color: #dee2e6;
-                }
-            """)
+            self.mic_button.setIcon(self.mic_icon('black'))
+            self.mic_button.setStyleSheet(MIC_BUTTON_LIGHT_QSS)
     
     def cleanup(self):
         """Clean up resources when widget is being destroyed."""
@@ -722,11 +1130,10 @@ class ListeningOverlay(QWidget):
         
         self.setLayout(layout)
         
-        # Animation
+        # Animation (only runs while the overlay is visible)
         self.dots = 0
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_animation)
-        self.timer.start(500)
         
         # Set fixed size for the overlay
         self.setFixedSize(280, 180)
@@ -740,11 +1147,14 @@ class ListeningOverlay(QWidget):
     
     def update_mic_icon(self, recording=False):
         if AppSettings.theme == 'dark':
-            icon = qta.icon('fa5s.microphone' + ('-slash' if not recording else ''), color='white')
+            color = 'white'
         else:
             color = '#4CAF50' if recording else 'gray'
-            icon = qta.icon('fa5s.microphone' + ('-slash' if not recording else ''), color=color)
-        self.mic_label.setPixmap(icon.pixmap(40, 40))  # Slightly larger icon
+        name = 'fa5s.microphone' + ('-slash' if not recording else '')
+        # Rendered once and shared by every overlay
+        pixmap = cached_pixmap(f"{name}_{color}_40",
+                               lambda: qta.icon(name, color=color).pixmap(40, 40))  # Slightly larger icon
+        self.mic_label.setPixmap(pixmap)
     
     def set_status_label_color(self):
         if AppSettings.theme == 'dark':
@@ -796,8 +1206,11 @@ class ListeningOverlay(QWidget):
         self.fade_anim.setStartValue(0.0)
         self.fade_anim.setEndValue(1.0)
         self.fade_anim.start()
+        self.timer.start(500)
     
     def hideEvent(self, event):
+        # No need to animate the dots while hidden
+        self.timer.stop()
         # Fade out before hiding
         self.fade_anim.setStartValue(1.0)
         self.fade_anim.setEndValue(0.0)
@@ -826,6 +1239,108 @@ def set_secure_file_permissions(filepath):
     except Exception as e:
         logger.warning(f"Could not set secure permissions on {filepath}: {e}")
 
+# ASCII control characters, removed from user input in a single C-level pass
+_NONPRINT_TABLE = dict.fromkeys(i for i in range(128) if not chr(i).isprintable())
+
+def sanitize(text, maxlen=256):
+    """Strip whitespace, drop non-printable characters and limit the length of user input."""
+    text = text.strip().translate(_NONPRINT_TABLE)
+    # Only walk the string per character when non-ASCII non-printables remain
+    if not text.isprintable():
+        text = ''.join(c for c in text if c.isprintable())
+    return text[:maxlen]
+
+# -----------------------------
+# Event date helpers
+# -----------------------------
+# Most events come back unchanged on every 30 s refresh, so parsed and formatted
+# values are cached by their raw string; the bound keeps odd inputs from growing them
+# Python 3.11+ parses a trailing 'Z' itself, so the '+00:00' rewrite (a string copy) is only needed before that
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+@functools.lru_cache(maxsize=8192)
+def parse_event_datetime(value):
+    """Parse a Calendar API 'dateTime' or all-day 'date' string into a datetime."""
+    if 'T' not in value:
+        return datetime.fromisoformat(value)
+    if _parse_iso_datetime is not None:
+        return _parse_iso_datetime(value)
+    if value[-1] == 'Z':
+        # UTC values use fixed layouts, 'YYYY-MM-DDTHH:MM:SSZ' or with '.fff' milliseconds
+        if len(value) == 20:
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]),
+                            int(value[14:16]), int(value[17:19]), tzinfo=timezone.utc)
+        if len(value) == 24 and value[19] == '.':
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]),
+                            int(value[14:16]), int(value[17:19]), int(value[20:23]) * 1000,
+                            tzinfo=timezone.utc)
+        if _FROMISOFORMAT_ACCEPTS_Z:
+            return datetime.fromisoformat(value)
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
+
+WEEKDAY_KEYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+@functools.lru_cache(maxsize=8192)
+def format_event_time(value, language):
+    """Format a Calendar API date/dateTime string with its weekday for the event tables."""
+    weekday_name = tr(WEEKDAY_KEYS[parse_event_datetime(value).weekday()], language)
+    # Times are shown in the event's own offset, so the date and HH:MM are copied
+    # straight out of the ISO string instead of going through strftime
+    if 'T' not in value:
+        return f"{value[:10]} ({weekday_name}) ({tr('all_day', language)})"
+    return f"{value[:10]} ({weekday_name}) {value[11:16]}"
+
+def events_signature(events):
+    """Cheap fingerprint of an events payload; changes whenever an event is added, edited or removed."""
+    return hash(tuple((e.get('id'), e.get('updated'), e.get('status')) for e in events))
+
+# -----------------------------
+# LoginWorker: credential refresh and calendar lookup off the UI thread
+# -----------------------------
+# Workers whose dialog closed before they finished, kept alive until their thread exits
+_DETACHED_LOGIN_WORKERS = set()
+
+class LoginWorker(QThread):
+    """
+    Gets valid credentials and checks the calendar ID against the API.
+    Emits succeeded(credentials, calendar_id_from_api) or failed(message).
+    """
+    succeeded = pyqtSignal(object, str)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, calendar_id, allow_new_credentials=True, parent=None):
+        super().__init__(parent)
+        self.calendar_id = calendar_id
+        self.allow_new_credentials = allow_new_credentials  # False for auto-login: never open the OAuth flow
+    
+    def run(self):
+        try:
+            # Try to get valid credentials using token manager
+            creds = token_manager.get_valid_credentials()
+            
+            # If no valid credentials, create new ones
+            if not creds:
+                if not self.allow_new_credentials:
+                    self.failed.emit("No valid credentials found")
+                    return
+                if not os.path.exists('credentials.json'):
+                    self.failed.emit("credentials.json file is missing. Please place your Google API credentials file in the app directory.")
+                    return
+                
+                creds = token_manager.create_new_credentials()
+                if not creds:
+                    self.failed.emit("Failed to create new credentials. Please check your credentials.json file.")
+                    return
+            
+            # Test the connection with the calendar ID
+            service = get_calendar_service(creds)
+            calendar = service.calendars().get(calendarId=self.calendar_id).execute()
+            self.succeeded.emit(creds, calendar.get('id', 'Unknown'))
+        except Exception as e:
+            logger.error(f"Authentication error: {e}")
+            self.failed.emit(f"{tr('event_failed')} {str(e)}")
+
 class LoginDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -863,44 +1378,62 @@ class LoginDialog(QDialog):
         buttons.accepted.connect(self.login)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
+        self.ok_button = buttons.button(QDialogButtonBox.Ok)
         
         self.setLayout(layout)
         
         # Store the last calendar ID for potential auto-login
         self.last_calendar_id = last_calendar_id
+        self._login_worker = None  # LoginWorker in flight, if any
+    
+    def _start_login_worker(self, calendar_id, allow_new_credentials, on_success, on_failure):
+        # Network and token work happen on the worker; the dialog stays responsive meanwhile
+        self.ok_button.setEnabled(False)
+        self._login_worker = LoginWorker(calendar_id, allow_new_credentials, self)
+        self._login_worker.succeeded.connect(on_success)
+        self._login_worker.failed.connect(on_failure)
+        self._login_worker.finished.connect(lambda: self.ok_button.setEnabled(True))
+        self._login_worker.start()
+    
+    def _login_busy(self):
+        return self._login_worker is not None and self._login_worker.isRunning()
+    
+    def done(self, result):
+        # A worker still waiting on the network outlives the dialog; drop its
+        # connections and keep a reference until its thread exits
+        worker = self._login_worker
+        if worker is not None and worker.isRunning():
+            for signal in (worker.succeeded, worker.failed, worker.finished):
+                signal.disconnect()
+            worker.setParent(None)
+            _DETACHED_LOGIN_WORKERS.add(worker)
+            worker.finished.connect(lambda: _DETACHED_LOGIN_WORKERS.discard(worker))
+        self._login_worker = None
+        super().done(result)
         
     def try_auto_login(self):
         """Attempt to automatically log in using stored token and calendar ID."""
-        try:
-            logger.info("Attempting auto-login...")
-            self.status_label.setText("Attempting auto-login...")
-            QApplication.processEvents()  # Update UI
-            
-            # Use the stored calendar ID directly
-            calendar_id = self.last_calendar_id
-            
-            # Get valid credentials using token manager
-            creds = token_manager.get_valid_credentials()
-            if creds:
-                # Test the connection with stored calendar ID
-                service = build('calendar', 'v3', credentials=creds)
-                calendar = service.calendars().get(calendarId=calendar_id).execute()
-                self.user_email = calendar.get('id', 'Unknown')
-                self.credentials = creds
-                self.calendar_id = calendar_id
-                logger.info("Auto-login successful!")
-                self.status_label.setText("Auto-login successful!")
-                QApplication.processEvents()
-                # Small delay to show success message
-                QTimer.singleShot(1000, self.accept)
-            else:
-                logger.info("No valid credentials available for auto-login")
-                self.status_label.setText("No valid credentials found")
-        except Exception as e:
-            logger.info(f"Auto-login failed: {e}")
-            self.status_label.setText(f"Auto-login failed: {str(e)}")
-            # Auto-login failed, user will need to manually log in
-            pass
+        if self._login_busy():
+            return
+        logger.info("Attempting auto-login...")
+        self.status_label.setText("Attempting auto-login...")
+        # Use the stored calendar ID directly
+        self._start_login_worker(self.last_calendar_id, False,
+                                 self._on_auto_login_succeeded, self._on_auto_login_failed)
+    
+    def _on_auto_login_succeeded(self, creds, user_email):
+        self.user_email = user_email
+        self.credentials = creds
+        self.calendar_id = self.last_calendar_id
+        logger.info("Auto-login successful!")
+        self.status_label.setText("Auto-login successful!")
+        # Small delay to show success message
+        QTimer.singleShot(1000, self.accept)
+    
+    def _on_auto_login_failed(self, message):
+        # Auto-login failed, user will need to manually log in
+        logger.info(f"Auto-login failed: {message}")
+        self.status_label.setText(f"Auto-login failed: {message}")
     
     def showEvent(self, event):
         """Override to handle auto-login after dialog is shown."""
@@ -921,40 +1454,28 @@ class LoginDialog(QDialog):
                 self.status_label.setText("No stored token found")
         
     def login(self):
+        if self._login_busy():
+            return
         self.calendar_id = self.calendar_id_input.text().strip()
         if not self.calendar_id:
             QMessageBox.warning(self, tr('error'), tr('calendar_id'))
             return
-        try:
-            # Try to get valid credentials using token manager
-            creds = token_manager.get_valid_credentials()
-            
-            # If no valid credentials, create new ones
-            if not creds:
-                if not os.path.exists('credentials.json'):
-                    QMessageBox.critical(self, tr('error'), "credentials.json file is missing. Please place your Google API credentials file in the app directory.")
-                    return
-                
-                creds = token_manager.create_new_credentials()
-                if not creds:
-                    QMessageBox.critical(self, tr('error'), "Failed to create new credentials. Please check your credentials.json file.")
-                    return
-            
-            # Test the connection with provided calendar ID
-            service = build('calendar', 'v3', credentials=creds)
-            calendar = service.calendars().get(calendarId=self.calendar_id).execute()
-            self.user_email = calendar.get('id', 'Unknown')
-            self.credentials = creds
-            
-            # Save the calendar ID for future use
-            settings = QSettings("SEINX", "Calendar")
-            settings.setValue("last_calendar_id", self.calendar_id)
-            
-            self.accept()
-        except Exception as e:
-            logger.error(f"Authentication error: {e}")
-            QMessageBox.warning(self, tr('error'), f"{tr('event_failed')} {str(e)}")
-            return
+        self.status_label.setText("Signing in...")
+        self._start_login_worker(self.calendar_id, True, self._on_login_succeeded, self._on_login_failed)
+    
+    def _on_login_succeeded(self, creds, user_email):
+        self.user_email = user_email
+        self.credentials = creds
+        
+        # Save the calendar ID for future use
+        settings = QSettings("SEINX", "Calendar")
+        settings.setValue("last_calendar_id", self.calendar_id)
+        
+        self.accept()
+    
+    def _on_login_failed(self, message):
+        self.status_label.setText("")
+        QMessageBox.warning(self, tr('error'), message)
 
 class DateSearchDialog(QDialog):
     def __init__(self, parent=None):
@@ -1004,35 +1525,24 @@ class AddEventDialog(QDialog):
         
         # Create completer for autocomplete functionality
         self.name_completer = QCompleter()
+        # One model for the dialog's lifetime; suggestions swap its string list in place
+        self._name_model = QStringListModel(self)
+        self._name_suggestions = []  # Python copy of the model's list, to skip no-op updates
+        self.name_completer.setModel(self._name_model)
         self.name_completer.setCaseSensitivity(Qt.CaseInsensitive)
         self.name_completer.setCompletionMode(QCompleter.PopupCompletion)
         self.name_completer.setMaxVisibleItems(8)
         self.name_edit.setCompleter(self.name_completer)
         
         # Custom styling for modern input field
-        if AppSettings.theme == 'dark':
-            self.name_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: #2c313a;
-                    color: white;
-                    min-height: 20px;
-                }
-            """)
-        else:
-            self.name_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: white;
-                    min-height: 20px;
-                }
-            """)
-        
-        # Connect text changed signal for dynamic suggestions
+        self.name_edit.setStyleSheet(LINE_EDIT_DARK_QSS if AppSettings.theme == 'dark' else LINE_EDIT_LIGHT_QSS)
+        
+        # Connect text changed signal for dynamic suggestions; the search itself
+        # runs once typing pauses rather than on every keystroke
+        self._name_search_timer = QTimer(self)
+        self._name_search_timer.setSingleShot(True)
+        self._name_search_timer.setInterval(80)
+        self._name_search_timer.timeout.connect(self._run_name_search)
         self.name_edit.textChanged.connect(self.on_name_text_changed)
         
         self.name_speech = SpeechToTextWidget(target_field=self.name_edit)
@@ -1052,27 +1562,7 @@ class AddEventDialog(QDialog):
         location_label.setFixedWidth(80)  # Fixed width for label consistency
         
         self.location_edit = QLineEdit()
-        if AppSettings.theme == 'dark':
-            self.location_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: #2c313a;
-                    color: white;
-                    min-height: 20px;
-                }
-            """)
-        else:
-            self.location_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: white;
-                    min-height: 20px;
-                }
-            """)
+        self.location_edit.setStyleSheet(LINE_EDIT_DARK_QSS if AppSettings.theme == 'dark' else LINE_EDIT_LIGHT_QSS)
         
         self.location_speech = SpeechToTextWidget(target_field=self.location_edit)
         self.location_speech.textCaptured.connect(lambda text: self.location_edit.setText(text))
@@ -1202,50 +1692,9 @@ class AddEventDialog(QDialog):
     
     def update_field_styling(self):
         """Update input field styling based on current theme."""
-        if AppSettings.theme == 'dark':
-            # Dark theme styling for name field
-            self.name_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: #2c313a;
-                    color: white;
-                    min-height: 20px;
-                }
-            """)
-            # Dark theme styling for location field
-            self.location_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: #2c313a;
-                    color: white;
-                    min-height: 20px;
-                }
-            """)
-        else:
-            # Light theme styling for name field
-            self.name_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: white;
-                    min-height: 20px;
-                }
-            """)
-            # Light theme styling for location field
-            self.location_edit.setStyleSheet("""
-                QLineEdit {
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                    padding: 5px;
-                    background-color: white;
-                    min-height: 20px;
-                }
-            """)
+        line_edit_qss = LINE_EDIT_DARK_QSS if AppSettings.theme == 'dark' else LINE_EDIT_LIGHT_QSS
+        self.name_edit.setStyleSheet(line_edit_qss)
+        self.location_edit.setStyleSheet(line_edit_qss)
         
         # Update microphone button styling too
         self.name_speech.update_theme()
@@ -1259,27 +1708,35 @@ class AddEventDialog(QDialog):
         """Load saved names into the completer for suggestions."""
         try:
             saved_names = name_manager.get_names()
-            model = QStringListModel(saved_names)
-            self.name_completer.setModel(model)
+            self._set_name_suggestions(saved_names)
             logger.info(f"Loaded {len(saved_names)} saved names into completer")
         except Exception as e:
             logger.error(f"Error loading saved names: {e}")
     
 
     
+    def _set_name_suggestions(self, names):
+        # Resetting the model makes the completer rebuild its proxy, so skip identical lists
+        if names != self._name_suggestions:
+            self._name_suggestions = names
+            self._name_model.setStringList(names)
+    
     def on_name_text_changed(self, text):
-        """Handle text changes to show dynamic suggestions with fuzzy search."""
+        """Restart the debounce timer; suggestions are refreshed when it fires."""
+        self._name_search_timer.start()
+    
+    def _run_name_search(self):
+        """Show dynamic suggestions for the current text with fuzzy search."""
+        text = self.name_edit.text()
         try:
             if not text:
                 # If text is empty, show recent names
                 recent_names = name_manager.get_recent_names(3)
-                model = QStringListModel(recent_names)
-                self.name_completer.setModel(model)
+                self._set_name_suggestions(recent_names)
             else:
                 # Use fuzzy search for better matching
                 matching_names = name_manager.fuzzy_search(text, max_results=8)
-                model = QStringListModel(matching_names)
-                self.name_completer.setModel(model)
+                self._set_name_suggestions(matching_names)
                 
         except Exception as e:
             logger.error(f"Error in name suggestions: {e}")
@@ -1291,17 +1748,15 @@ class AddEventDialog(QDialog):
         if not self.name_edit.text():
             # Show recent names when dialog opens for new events
             recent_names = name_manager.get_recent_names(3)
-            model = QStringListModel(recent_names)
-            self.name_completer.setModel(model)
+            self._set_name_suggestions(recent_names)
     
     def update_start_weekday(self):
         """Update the start weekday label based on selected date."""
         date = self.start_date.date()
         weekday = date.dayOfWeek()
-        # Qt returns 1-7 for Monday-Sunday, map to our translation keys
-        weekday_map = {1: 'mon', 2: 'tue', 3: 'wed', 4: 'thu', 5: 'fri', 6: 'sat', 7: 'sun'}
-        weekday_key = weekday_map.get(weekday, 'mon')
-        self.start_weekday_label.setText(tr(weekday_key))
+        # Qt returns 1-7 for Monday-Sunday (0 for an invalid date, shown as Monday)
+        weekday_key = WEEKDAY_KEYS[weekday - 1] if weekday else 'mon'
+        self.start_weekday_label.setText(tr_fast(weekday_key))
         
         # Update styling based on theme
         if AppSettings.theme == 'dark':
@@ -1329,10 +1784,9 @@ class AddEventDialog(QDialog):
         """Update the end weekday label based on selected date."""
         date = self.end_date.date()
         weekday = date.dayOfWeek()
-        # Qt returns 1-7 for Monday-Sunday, map to our translation keys
-        weekday_map = {1: 'mon', 2: 'tue', 3: 'wed', 4: 'thu', 5: 'fri', 6: 'sat', 7: 'sun'}
-        weekday_key = weekday_map.get(weekday, 'mon')
-        self.end_weekday_label.setText(tr(weekday_key))
+        # Qt returns 1-7 for Monday-Sunday (0 for an invalid date, shown as Monday)
+        weekday_key = WEEKDAY_KEYS[weekday - 1] if weekday else 'mon'
+        self.end_weekday_label.setText(tr_fast(weekday_key))
         
         # Update styling based on theme
         if AppSettings.theme == 'dark':
@@ -1456,9 +1910,6 @@ class AddEventDialog(QDialog):
         end_dt = QDateTime(end_date, end_time).toPyDateTime()
         
         # Sanitize user input: strip, limit length, remove dangerous chars
-        def sanitize(text, maxlen=256):
-            return ''.join(c for c in text.strip() if c.isprintable())[:maxlen]
-        
         event_name = sanitize(self.name_edit.text())
         
         # Save the name for future autocomplete
@@ -1474,36 +1925,206 @@ class AddEventDialog(QDialog):
             'is_all_day': is_all_day
         }
 
-class CalendarTable(QTableWidget):
+class CalendarModel(QAbstractTableModel):
+    """
+    Table model behind CalendarTable. Rows are stored as parallel per-column lists
+    of preformatted strings, so the view only asks for the cells it paints.
+    """
+    COLUMN_KEYS = ('name', 'location', 'start_date', 'end_date', 'remarks')
+    HIGHLIGHT_BRUSH = QBrush(QColor("#0078d4"))  # Blue highlight for the clicked row
+    # (background, foreground) of separator rows per (kind, theme)
+    SEPARATOR_COLORS = {
+        ('date_separator', 'dark'): (QColor("#2c313a"), QColor("#4a9eff")),
+        ('date_separator', 'light'): (QColor("#f8f9fa"), QColor("#1976d2")),
+        ('breaker', 'dark'): (QColor("#333333"), QColor("#ffffff")),
+        ('breaker', 'light'): (QColor("#f0f0f0"), QColor("#222222")),
+    }
+    _separator_font = None  # Shared by all models; QFont needs a QApplication, so built on first use
+    
+    @classmethod
+    def separator_font(cls):
+        if cls._separator_font is None:
+            cls._separator_font = QFont("Arial", 10, QFont.Bold)
+        return cls._separator_font
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+        self.locations = []
+        self.start_strs = []
+        self.end_strs = []
+        self.remarks = []
+        self.columns = (self.names, self.locations, self.start_strs, self.end_strs, self.remarks)
+        self.events = []  # Event dict per row, None for separator and blank rows
+        self.kinds = []  # 'date_separator' / 'breaker' for separator rows, else None
+        self.filler_rows = 0  # Empty rows after the data so the table fills the view
+        self.highlighted_row = None
+        self.separator_colors = {}  # kind -> (background, foreground) for the current theme
+        self.apply_theme()
+    
+    def apply_theme(self):
+        """Pick the separator colours for AppSettings.theme; data() reads them without re-checking."""
+        theme = 'dark' if AppSettings.theme == 'dark' else 'light'
+        self.separator_colors = {kind: colors for (kind, kind_theme), colors in self.SEPARATOR_COLORS.items()
+                                 if kind_theme == theme}
+    
+    def set_events(self, events=(), upcoming_events=(), custom_title=None, min_rows=0):
+        """Replace all rows with the given events, adding the title/upcoming separators."""
+        self.beginResetModel()
+        for column in self.columns:
+            column.clear()
+        self.events.clear()
+        self.kinds.clear()
+        self.highlighted_row = None
+        if custom_title:
+            self._append_row((custom_title, '', '', '', ''), kind='date_separator')
+        self._append_events(events)
+        if upcoming_events:
+            # Blank row before the separator (only if we don't have a custom title)
+            if not custom_title:
+                self._append_row(('', '', '', '', ''))
+            self._append_row((tr_fast('upcoming_events'), '', '', '', ''), kind='breaker')
+            self._append_events(upcoming_events)
+        self.filler_rows = max(0, min_rows - len(self.events))
+        self.endResetModel()
+    
+    def _append_events(self, events):
+        # Bind the per-row lookups once; this loop runs for every event on each refresh
+        language = AppSettings.language
+        format_time = format_event_time
+        add_name = self.names.append
+        add_location = self.locations.append
+        add_start = self.start_strs.append
+        add_end = self.end_strs.append
+        add_remarks = self.remarks.append
+        add_event = self.events.append
+        add_kind = self.kinds.append
+        for event in events:
+            get = event.get
+            start_dict = event['start']
+            end_dict = event['end']
+            add_name(get('summary', 'No Title'))
+            add_location(get('location', ''))
+            add_start(format_time(start_dict.get('dateTime') or start_dict.get('date'), language))
+            add_end(format_time(end_dict.get('dateTime') or end_dict.get('date'), language))
+            add_remarks(get('description', ''))
+            add_event(event)
+            add_kind(None)
+    
+    def _append_row(self, values, event=None, kind=None):
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        self.events.append(event)
+        self.kinds.append(kind)
+    
+    def separator_rows(self):
+        return [row for row, kind in enumerate(self.kinds) if kind is not None]
+    
+    def event_at(self, row):
+        return self.events[row] if 0 <= row < len(self.events) else None
+    
+    def row_kind(self, row):
+        return self.kinds[row] if 0 <= row < len(self.kinds) else None
+    
+    def set_highlighted_row(self, row):
+        """Move the highlight, repainting only the rows it leaves and enters."""
+        previous = self.highlighted_row
+        self.highlighted_row = row
+        for changed in (previous, row):
+            if changed is not None:
+                self.dataChanged.emit(self.index(changed, 0), self.index(changed, len(self.columns) - 1),
+                                      [Qt.BackgroundRole])
+    
+    def refresh_headers(self):
+        """Re-read the translated column titles."""
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.COLUMN_KEYS) - 1)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.events) + self.filler_rows
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMN_KEYS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return tr_fast(self.COLUMN_KEYS[section])
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        kind = self.kinds[row] if row < len(self.kinds) else None
+        if role == Qt.DisplayRole:
+            return self.columns[index.column()][row] if row < len(self.events) else ""
+        if kind is None:
+            # Event, blank and filler rows keep the alternating colours unless highlighted
+            if role == Qt.BackgroundRole and row == self.highlighted_row:
+                return self.HIGHLIGHT_BRUSH
+            return None
+        if role in (Qt.BackgroundRole, Qt.ForegroundRole):
+            background, foreground = self.separator_colors[kind]
+            return background if role == Qt.BackgroundRole else foreground
+        if role == Qt.FontRole:
+            return self.separator_font()
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.UserRole:
+            return kind
+        return None
+
+class CalendarTable(QTableView):
+    _ACTION_ICONS = {}  # (edit, delete) icons per theme, loaded on first use
+    _ADD_ICONS = {}  # Add-event icon per theme, loaded on first use
+    
+    @classmethod
+    def action_icons(cls, theme):
+        """Get the edit/delete icons for a theme, resolving them only once."""
+        icons = cls._ACTION_ICONS.get(theme)
+        if icons is None:
+            if theme == 'dark':
+                icons = (QIcon('icons/edit_white.png'), QIcon('icons/delete_white.png'))
+            else:
+                icons = (QIcon.fromTheme('edit', QIcon('icons/edit.png')),
+                         QIcon.fromTheme('delete', QIcon('icons/delete.png')))
+            cls._ACTION_ICONS[theme] = icons
+        return icons
+    
+    @classmethod
+    def add_icon(cls, theme):
+        """Get the add-event icon for a theme, checking for icons/add.png only once."""
+        icon = cls._ADD_ICONS.get(theme)
+        if icon is None:
+            if os.path.exists('icons/add.png'):
+                icon = QIcon('icons/add.png')
+            else:
+                icon = qta.icon('fa5s.plus', color='white' if theme == 'dark' else 'black')
+            cls._ADD_ICONS[theme] = icon
+        return icon
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_app = parent
-        self.setColumnCount(5)
-        self.setHorizontalHeaderLabels([
-            tr('name'), tr('location'), tr('start_date'), tr('end_date'), tr('remarks')
-        ])
-        self.event_data = {}  # Store event data by row
+        self.calendar_model = CalendarModel(self)
+        self.setModel(self.calendar_model)
+        self.events_signature = None  # Fingerprint of the payload last shown by load_events
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.viewport().installEventFilter(self)
         header = self.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Interactive)
-        header.setSectionResizeMode(1, QHeaderView.Interactive)
-        header.setSectionResizeMode(2, QHeaderView.Interactive)
-        header.setSectionResizeMode(3, QHeaderView.Interactive)
+        # Every column is user-resizable except Remarks, which takes the remaining width
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(4, QHeaderView.Stretch)
-        total_width = self.viewport().width()
-        self.setColumnWidth(0, int(total_width * 0.25))
-        self.setColumnWidth(1, int(total_width * 0.25))
-        self.setColumnWidth(2, int(total_width * 0.18))
-        self.setColumnWidth(3, int(total_width * 0.18))
-        # Remarks column (index 4) will adjust automatically due to Stretch mode
+        # Coalesce bursts of viewport resize events into one column reflow
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_column_widths)
+        self._apply_column_widths()
         # Disable default selection behavior to prevent interference with custom highlighting
         self.setSelectionMode(QAbstractItemView.NoSelection)
         self.setAlternatingRowColors(True)
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.cellClicked.connect(self.handle_event_cell_click)
-        self.actions_widget = None
-        self.highlighted_row = None
+        self.clicked.connect(lambda index: self.handle_event_cell_click(index.row(), index.column()))
+        self._build_actions_widget()
+        self._build_add_widget()
         self.actions_timer = QTimer(self)
         self.actions_timer.setSingleShot(True)
         self.actions_timer.timeout.connect(self.hide_actions_widget)
@@ -1512,118 +2133,116 @@ class CalendarTable(QTableWidget):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         # Hide row numbers
         self.verticalHeader().setVisible(False)
+    
+    @property
+    def highlighted_row(self):
+        return self.calendar_model.highlighted_row
+    
+    def set_events(self, events, upcoming_events=(), custom_title=None):
+        """Show the given events, padding with empty rows to fill the visible area."""
+        self.hide_actions_widget()
+        # Add empty rows for better UX
+        visible_rows = self.viewport().height() // max(1, self.verticalHeader().defaultSectionSize())
+        # The model reset and the span changes below land in a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.calendar_model.set_events(events, upcoming_events, custom_title, visible_rows)
+            self.clearSpans()
+            for row in self.calendar_model.separator_rows():
+                self.setSpan(row, 0, 1, self.calendar_model.columnCount())  # Merge all columns for the separator row
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def clear_events(self):
+        """Remove every row, e.g. when logged out."""
+        self.hide_actions_widget()
+        self.calendar_model.set_events()
+        self.clearSpans()
+        self.events_signature = None
+    
+    def _build_actions_widget(self):
+        """Create the edit/delete buttons once; each click only repositions them."""
+        self._actions_event = None  # Event the edit/delete buttons act on
+        self.actions_widget = QWidget(self)
+        layout = QHBoxLayout(self.actions_widget)
+        layout.setSpacing(3)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._edit_btn = QPushButton(self.actions_widget)
+        self._edit_btn.setToolTip('Edit')
+        self._edit_btn.setStyleSheet('border: none; background: transparent; color: white;')
+        self._edit_btn.setCursor(Qt.PointingHandCursor)
+        self._edit_btn.clicked.connect(lambda: self.parent_app.update_event(self._actions_event))
+        self._delete_btn = QPushButton(self.actions_widget)
+        self._delete_btn.setToolTip('Delete')
+        self._delete_btn.setStyleSheet('border: none; background: transparent; color: white;')
+        self._delete_btn.setCursor(Qt.PointingHandCursor)
+        self._delete_btn.clicked.connect(lambda: self.parent_app.delete_event(self._actions_event))
+        layout.addWidget(self._edit_btn)
+        layout.addWidget(self._delete_btn)
+        self.actions_widget.hide()
+    
+    def _build_add_widget(self):
+        """Create the add button for empty rows once; each click only repositions it."""
+        self.add_widget = QWidget(self)
+        layout = QHBoxLayout(self.add_widget)
+        layout.setSpacing(3)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._add_btn = QPushButton(self.add_widget)
+        self._add_btn.setToolTip('Add Event')
+        self._add_btn.setStyleSheet('border: none; background: transparent; color: white;')
+        self._add_btn.setCursor(Qt.PointingHandCursor)
+        self._add_btn.clicked.connect(lambda: self.parent_app.add_event())
+        layout.addWidget(self._add_btn)
+        self.add_widget.hide()
     def handle_event_cell_click(self, row, column):
         # Check if clicking on separator rows (don't highlight them)
-        item = self.item(row, 0)
-        if item and (item.data(Qt.UserRole) == 'date_separator' or item.data(Qt.UserRole) == 'breaker'):
+        if self.calendar_model.row_kind(row) is not None:
             return  # Don't highlight separator rows
         
         # Check if clicking on the same row that's already highlighted
         if self.highlighted_row == row:
-            # Toggle off - remove highlighting and hide action buttons
+            # Toggle off - hiding the actions also clears the row's highlight
             self.hide_actions_widget()
-            # Directly clear the highlight for this specific row
-            for col in range(self.columnCount()):
-                item = self.item(row, col)
-                if item:
-                    if AppSettings.theme == 'dark':
-                        item.setBackground(QColor('#2c313a'))
-                    else:
-                        item.setBackground(QColor('white'))
-            self.highlighted_row = None
-            self.viewport().update()
             return
         
-        # Highlight the clicked row with blue color
-        self.clear_highlight()
-        for col in range(self.columnCount()):
-            item = self.item(row, col)
-            if item:
-                item.setBackground(QColor("#0078d4"))  # Blue highlight
-        self.highlighted_row = row
+        # Highlight the clicked row
+        self.calendar_model.set_highlighted_row(row)
         
         # Check if this is an empty row (no event data)
-        item = self.item(row, 0)
-        if item is None or item.text() == "":
+        if self.calendar_model.event_at(row) is None:
             # Show add button for empty rows
             self.show_add_button(row)
             return
-        if item.text() == "Upcoming Events":
-            return
             
         # Show edit/delete actions for existing events
-        if self.actions_widget:
-            self.actions_widget.hide()
-            self.actions_widget.deleteLater()
+        self.add_widget.hide()
         self.show_actions_widget(row)
         self.setMouseTracking(True)
         # Keep actions visible for 5 seconds unless user clicks elsewhere
         self.actions_timer.start(5000)
     def show_add_button(self, row):
         """Show add button for empty rows."""
-        if self.actions_widget:
-            self.actions_widget.hide()
-            self.actions_widget.deleteLater()
-        
-        self.actions_widget = QWidget(self)
-        layout = QHBoxLayout(self.actions_widget)
-        layout.setSpacing(3)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        add_btn = QPushButton(self.actions_widget)
-        if AppSettings.theme == 'dark':
-            add_icon = QIcon('icons/add.png') if os.path.exists('icons/add.png') else qta.icon('fa5s.plus', color='white')
-        else:
-            add_icon = QIcon('icons/add.png') if os.path.exists('icons/add.png') else qta.icon('fa5s.plus', color='black')
-        
-        add_btn.setIcon(add_icon)
-        add_btn.setToolTip('Add Event')
-        add_btn.setStyleSheet('border: none; background: transparent; color: white;')
-        add_btn.setCursor(Qt.PointingHandCursor)
-        add_btn.clicked.connect(self.parent_app.add_event)
-        
-        layout.addWidget(add_btn)
-        
-        rect = self.visualItemRect(self.item(row, 4))
-        self.actions_widget.setFixedSize(40, rect.height()-2)
+        self.actions_widget.hide()
+        self._add_btn.setIcon(self.add_icon(AppSettings.theme))
+        rect = self.visualRect(self.calendar_model.index(row, 4))
+        self.add_widget.setFixedSize(40, rect.height()-2)
         horizontal_pos = rect.x() + rect.width() - 45
         vertical_pos = rect.y() - 1
         if horizontal_pos < rect.x():
             horizontal_pos = rect.x() + 5
-        self.actions_widget.move(horizontal_pos, vertical_pos)
-        self.actions_widget.show()
+        self.add_widget.move(horizontal_pos, vertical_pos)
+        self.add_widget.show()
     
     def show_actions_widget(self, row):
-        event_data = self.event_data.get(row)
+        event_data = self.calendar_model.event_at(row)
         if not event_data:
+            self.actions_widget.hide()
             return
-        self.actions_widget = QWidget(self)
-        layout = QHBoxLayout(self.actions_widget)
-        layout.setSpacing(3)
-        layout.setContentsMargins(0, 0, 0, 0)
-        edit_btn = QPushButton(self.actions_widget)
-        if AppSettings.theme == 'dark':
-            edit_icon = QIcon('icons/edit_white.png')
-        else:
-            edit_icon = QIcon.fromTheme('edit', QIcon('icons/edit.png'))
-        edit_btn.setIcon(edit_icon)
-        edit_btn.setToolTip('Edit')
-        edit_btn.setStyleSheet('border: none; background: transparent; color: white;')
-        edit_btn.setCursor(Qt.PointingHandCursor)
-        edit_btn.clicked.connect(lambda: self.parent_app.update_event(event_data))
-        delete_btn = QPushButton(self.actions_widget)
-        if AppSettings.theme == 'dark':
-            delete_icon = QIcon('icons/delete_white.png')
-        else:
-            delete_icon = QIcon.fromTheme('delete', QIcon('icons/delete.png'))
-        delete_btn.setIcon(delete_icon)
-        delete_btn.setToolTip('Delete')
-        delete_btn.setStyleSheet('border: none; background: transparent; color: white;')
-        delete_btn.setCursor(Qt.PointingHandCursor)
-        delete_btn.clicked.connect(lambda: self.parent_app.delete_event(event_data))
-        layout.addWidget(edit_btn)
-        layout.addWidget(delete_btn)
-        rect = self.visualItemRect(self.item(row, 4))
+        self._actions_event = event_data
+        edit_icon, delete_icon = self.action_icons(AppSettings.theme)
+        self._edit_btn.setIcon(edit_icon)
+        self._delete_btn.setIcon(delete_icon)
+        rect = self.visualRect(self.calendar_model.index(row, 4))
         self.actions_widget.setFixedSize(60, rect.height()-2)
         horizontal_pos = rect.x() + rect.width() - 65
         vertical_pos = rect.y() - 1
@@ -1632,26 +2251,15 @@ class CalendarTable(QTableWidget):
         self.actions_widget.move(horizontal_pos, vertical_pos)
         self.actions_widget.show()
     def hide_actions_widget(self):
-        if self.actions_widget:
-            self.actions_widget.hide()
-            self.actions_widget.deleteLater()
-            self.actions_widget = None
+        self.actions_widget.hide()
+        self.add_widget.hide()
         # Stop the timer to prevent it from showing actions again
         self.actions_timer.stop()
         # Explicitly clear the highlight
         self.clear_highlight()
-        # Force a repaint to ensure the highlight is removed
-        self.viewport().update()
     def clear_highlight(self):
         if self.highlighted_row is not None:
-            for col in range(self.columnCount()):
-                item = self.item(self.highlighted_row, col)
-                if item:
-                    if AppSettings.theme == 'dark':
-                        item.setBackground(QColor('#2c313a'))
-                    else:
-                        item.setBackground(QColor('white'))
-            self.highlighted_row = None
+            self.calendar_model.set_highlighted_row(None)
     def leaveEvent(self, event):
         # Hide actions and highlight when mouse leaves the table or after timer
         if not self.underMouse():
@@ -1675,15 +2283,22 @@ class CalendarTable(QTableWidget):
         # Show menu at mouse position
         menu.exec_(QCursor.pos())
         
+    def _apply_column_widths(self):
+        """Size the columns proportionally to the viewport in a single layout pass."""
+        width = self.viewport().width()
+        self.setUpdatesEnabled(False)
+        self.setColumnWidth(0, int(width * 0.22))  # Name
+        self.setColumnWidth(1, int(width * 0.15))  # Location
+        self.setColumnWidth(2, int(width * 0.18))  # Start Date
+        self.setColumnWidth(3, int(width * 0.18))  # End Date
+        # Remarks column (index 4) will adjust automatically due to Stretch mode
+        self.setUpdatesEnabled(True)
+        self.viewport().update()
+    
     def eventFilter(self, obj, event):
         # Handle resize events to maintain column proportions
         if obj == self.viewport() and event.type() == QEvent.Resize:
-            width = self.viewport().width()
-            self.setColumnWidth(0, int(width * 0.22))  # Name
-            self.setColumnWidth(1, int(width * 0.15))  # Location
-            self.setColumnWidth(2, int(width * 0.18))  # Start Date
-            self.setColumnWidth(3, int(width * 0.18))  # End Date
-            # Remarks column (index 4) will adjust automatically due to Stretch mode
+            self._resize_timer.start()
         return super().eventFilter(obj, event)
 
 class UpdateEventDialog(AddEventDialog):
@@ -1706,19 +2321,8 @@ class UpdateEventDialog(AddEventDialog):
         end = event_data['end'].get('dateTime', event_data['end'].get('date'))
         
         # Handle both datetime and date-only formats
-        if 'T' in start:
-            # Has time component
-            start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-        else:
-            # Date only - use start of day
-            start_dt = datetime.fromisoformat(start)
-        
-        if 'T' in end:
-            # Has time component
-            end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-        else:
-            # Date only - use end of day
-            end_dt = datetime.fromisoformat(end)
+        start_dt = parse_event_datetime(start)
+        end_dt = parse_event_datetime(end)
         
         # Set the date and time separately
         self.start_date.setDate(QDate(start_dt.year, start_dt.month, start_dt.day))
@@ -1749,6 +2353,9 @@ class UpdateEventDialog(AddEventDialog):
 # SettingsDialog: Simple settings for language and theme
 # -----------------------------
 class SettingsDialog(QDialog):
+    # Combo box label -> interface language code, in display order
+    LANGUAGE_CODES = {"English": "en", "日本語": "ja"}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
@@ -1757,7 +2364,7 @@ class SettingsDialog(QDialog):
         # Language selection
         lang_label = QLabel("Language:")
         self.lang_combo = QComboBox()
-        self.lang_combo.addItems(["English", "日本語"])
+        self.lang_combo.addItems(list(self.LANGUAGE_CODES))
         layout.addWidget(lang_label)
         layout.addWidget(self.lang_combo)
         # Theme selection
@@ -1778,6 +2385,52 @@ class SettingsDialog(QDialog):
             'theme': self.theme_combo.currentText()
         }
 
+# -----------------------------
+# EventsWorker: fetches calendar events off the UI thread
+# -----------------------------
+class EventsWorkerSignals(QObject):
+    finished = pyqtSignal(object)  # List of event item lists, one per request
+    error = pyqtSignal(str)
+
+class EventsWorker(QRunnable):
+    """Sends prepared events().list() requests as one batch HTTP call on a QThreadPool thread."""
+    def __init__(self, events_resource, batch, requests, credentials):
+        super().__init__()
+        self.events_resource = events_resource  # Builds the follow-up page requests
+        self.batch = batch
+        self.requests = requests
+        self.credentials = credentials
+        self.signals = EventsWorkerSignals()
+    
+    def run(self):
+        results = [[] for _ in self.requests]
+        responses = [None] * len(self.requests)
+        errors = []
+        def collect(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+            else:
+                responses[int(request_id)] = response
+        try:
+            for i, request in enumerate(self.requests):
+                self.batch.add(request, callback=collect, request_id=str(i))
+            # httplib2 connections are not thread-safe, so this thread gets its own
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self.batch.execute(http=http)
+            # The first pages came back in the batch; follow nextPageToken for larger ranges
+            for i, request in enumerate(self.requests):
+                response = responses[i]
+                while response is not None:
+                    results[i].extend(response.get('items', []))
+                    request = self.events_resource.list_next(request, response)
+                    response = request.execute(http=http) if request is not None else None
+        except Exception as e:
+            errors.append(e)
+        if errors:
+            self.signals.error.emit(str(errors[0]))
+            return
+        self.signals.finished.emit(results)
+
 # -----------------------------
 # MainWindow: Main application window
 # -----------------------------
@@ -1817,16 +2470,84 @@ class SpinnerDialog(QDialog):
     def set_message(self, message):
         self.text_label.setText(message)
 
+# Only the event fields the tables and dialogs use; update_event sends a patch, so fields
+# not listed here are left as they are on the server
+EVENT_LIST_FIELDS = 'items(id,summary,location,description,start,end,status,updated),nextPageToken'
+
+# Main window stylesheets, built once and reused on every theme switch
+MAIN_WINDOW_DARK_QSS = """
+    QMainWindow { background-color: #23272e; color: white; }
+    QWidget { background-color: #2c313a; color: white; }
+    QTabWidget::pane { background-color: #23272e; }
+    QTabBar::tab { background-color: #2c313a; color: white; padding: 8px; }
+    QTabBar::tab:selected { background-color: #3a3f4b; }
+    QTableView { background-color: #23272e; alternate-background-color: #2c313a; }
+    QHeaderView::section { background-color: #3a3f4b; color: white; }
+    QPushButton { background-color: #3a3f4b; color: white; border: 1px solid #444a5a; padding: 5px; }
+    QPushButton:hover { background-color: #4f5668; }
+    QDialogButtonBox QPushButton { 
+        background-color: #3a3f4b; 
+        color: white; 
+        border: 1px solid #444a5a; 
+        padding: 8px 16px; 
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QDialogButtonBox QPushButton:hover { 
+        background-color: #4f5668; 
+        border-color: #555a6a;
+    }
+    QDialogButtonBox QPushButton:pressed { 
+        background-color: #2c313a; 
+        border-color: #3a3f4b;
+    }
+"""
+
+MAIN_WINDOW_LIGHT_QSS = """
+    QMainWindow { background-color: white; color: black; }
+    QWidget { background-color: white; color: black; }
+    QTabWidget::pane { background-color: #f0f0f0; }
+    QTabBar::tab { background-color: #e0e0e0; color: black; padding: 8px; }
+    QTabBar::tab:selected { background-color: #d0d0d0; }
+    QTableView { background-color: white; alternate-background-color: #f5f5f5; }
+    QHeaderView::section { background-color: #e0e0e0; color: black; }
+    QPushButton { background-color: #e0e0e0; color: black; border: 1px solid #ccc; padding: 5px; }
+    QPushButton:hover { background-color: #d0d0d0; }
+    QDialogButtonBox QPushButton { 
+        background-color: #e0e0e0; 
+        color: black; 
+        border: 1px solid #ccc; 
+        padding: 8px 16px; 
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QDialogButtonBox QPushButton:hover { 
+        background-color: #d0d0d0; 
+        border-color: #adb5bd;
+    }
+    QDialogButtonBox QPushButton:pressed { 
+        background-color: #c0c0c0; 
+        border-color: #a0a0a0;
+    }
+"""
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, progress=None):
         super().__init__()
+        self._progress = progress  # Optional QSplashScreen updated between setup stages
         self.service = None
+        self.credentials = None  # Credentials the service was built from; reused by EventsWorker
         self.user_email = ""
         self.calendar_id = None
         self.current_date = datetime.now().date()
         self.theme = "light"
         self.language = "en"
         self.is_date_specific_view = False  # Track if we're showing a specific date
+        self._events_loading = False  # An EventsWorker fetch is in flight
+        self._events_reload_pending = False  # load_events was called during that fetch
+        self._settings_menu = None  # Built on the first cog click
+        self._refresh_paused = False  # refresh_timer stopped while the window is hidden/minimized
+        self._qsettings = QSettings("SEINX", "Calendar")  # Reused rather than reopening the store per toggle
         
         # Set minimum size and get screen geometry
         self.setMinimumSize(1000, 600)
@@ -1846,7 +2567,9 @@ class MainWindow(QMainWindow):
         self.refresh_timer.timeout.connect(self.force_table_refresh)
         self.refresh_timer.setInterval(30000)  # 30 seconds
         
+        self._report_progress("Building interface...")
         self.setup_ui()
+        self._report_progress("Applying theme...")
         self.apply_theme()
         self.user_label.setText("No connected account")
         # Keyboard shortcuts
@@ -1856,9 +2579,19 @@ class MainWindow(QMainWindow):
         self.shortcut_quit.activated.connect(self.close)
         self.snackbar = Snackbar(self)
         
+        # Load the Whisper model in the background so the first voice press doesn't wait on it
+        threading.Thread(target=warm_up_whisper, args=(self._qsettings.value("speech_language", "en"),),
+                         daemon=True).start()
+        
         # Auto-show login dialog on startup
         QTimer.singleShot(100, self.auto_show_login)
     
+    def _report_progress(self, message):
+        # Repaint the splash screen between construction stages
+        if self._progress is not None:
+            self._progress.showMessage(message, Qt.AlignBottom | Qt.AlignHCenter)
+            QApplication.processEvents()
+    
     def setup_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -1983,7 +2716,7 @@ class MainWindow(QMainWindow):
         self.user_label.setStyleSheet("font-size: 18px; font-weight: bold;")
         
         # Date (right)
-        self.date_label = QLabel(self.current_date.strftime("%Y-%m-%d"))
+        self.date_label = QLabel(format_date_label(self.current_date))
         self.date_label.setStyleSheet("font-size: 16px; font-weight: bold;")
 
         # Today button (hidden by default)
@@ -2001,52 +2734,78 @@ class MainWindow(QMainWindow):
         
         return info_bar
     
-    def show_settings_menu(self):
+    def _build_settings_menu(self):
+        """Create the settings menu once; later clicks only toggle the login-dependent actions."""
         menu = QMenu(self)
+        labels = []  # (setText/setTitle, translation key) for retranslation
+        def add_menu(parent, key):
+            submenu = parent.addMenu(tr(key))
+            labels.append((submenu.setTitle, key))
+            return submenu
+        def add_action(parent, key, slot):
+            action = parent.addAction(tr(key), slot)
+            labels.append((action.setText, key))
+            return action
         # Language submenu at top level
-        lang_menu = menu.addMenu(tr('language'))
-        lang_menu.addAction(tr('english'), lambda: self.change_language('en'))
-        lang_menu.addAction(tr('japanese'), lambda: self.change_language('ja'))
+        lang_menu = add_menu(menu, 'language')
+        add_action(lang_menu, 'english', lambda: self.change_language('en'))
+        add_action(lang_menu, 'japanese', lambda: self.change_language('ja'))
         # Speech recognition language submenu
-        speech_menu = menu.addMenu(tr('speech_recognition'))
-        speech_menu.addAction(tr('auto_detect'), lambda: self.change_speech_language('auto'))
-        speech_menu.addAction(tr('english'), lambda: self.change_speech_language('en'))
-        speech_menu.addAction(tr('japanese'), lambda: self.change_speech_language('ja'))
+        speech_menu = add_menu(menu, 'speech_recognition')
+        add_action(speech_menu, 'auto_detect', lambda: self.change_speech_language('auto'))
+        add_action(speech_menu, 'english', lambda: self.change_speech_language('en'))
+        add_action(speech_menu, 'japanese', lambda: self.change_speech_language('ja'))
         # Auto-submit option
         self.auto_submit_action = menu.addAction(tr('auto_submit'))
+        labels.append((self.auto_submit_action.setText, 'auto_submit'))
         self.auto_submit_action.setCheckable(True)
-        self.auto_submit_action.setChecked(getattr(self, 'auto_submit', False))
         self.auto_submit_action.triggered.connect(self.toggle_auto_submit)
         # Theme submenu
-        theme_menu = menu.addMenu(tr('theme'))
-        theme_menu.addAction(tr('light'), lambda: self.change_theme('light'))
-        theme_menu.addAction(tr('dark'), lambda: self.change_theme('dark'))
-        if self.service:
-            menu.addAction(tr('search_by_date'), self.search_by_date)
-            menu.addAction(tr('add_event'), self.add_event)
-            menu.addSeparator()
-            menu.addAction(tr('logout'), self.logout)
-        else:
-            menu.addSeparator()
-            menu.addAction(tr('login'), self.show_login)
+        theme_menu = add_menu(menu, 'theme')
+        add_action(theme_menu, 'light', lambda: self.change_theme('light'))
+        add_action(theme_menu, 'dark', lambda: self.change_theme('dark'))
+        # Account actions, shown according to the login state
+        self._logged_in_actions = [
+            add_action(menu, 'search_by_date', self.search_by_date),
+            add_action(menu, 'add_event', self.add_event),
+        ]
+        menu.addSeparator()
+        self._logged_in_actions.append(add_action(menu, 'logout', self.logout))
+        self._login_action = add_action(menu, 'login', self.show_login)
+        self._settings_menu_labels = labels
+        self._settings_menu = menu
+    
+    def _retranslate_settings_menu(self):
+        if self._settings_menu is not None:
+            for set_text, key in self._settings_menu_labels:
+                set_text(tr(key))
+    
+    def show_settings_menu(self):
+        if self._settings_menu is None:
+            self._build_settings_menu()
+        logged_in = bool(self.service)
+        for action in self._logged_in_actions:
+            action.setVisible(logged_in)
+        self._login_action.setVisible(not logged_in)
+        self.auto_submit_action.setChecked(getattr(self, 'auto_submit', False))
         button_pos = self.cog_btn.mapToGlobal(self.cog_btn.rect().bottomLeft())
-        menu.exec_(button_pos)
+        self._settings_menu.exec_(button_pos)
     
     def auto_show_login(self):
         if not self.service:
-            settings = QSettings("SEINX", "Calendar")
-            last_calendar_id = settings.value("last_calendar_id", "")
+            last_calendar_id = self._qsettings.value("last_calendar_id", "")
             if last_calendar_id:
                 spinner = SpinnerDialog(self, "Logging in with saved credentials...")
                 def do_login():
                     try:
                         creds = token_manager.get_valid_credentials()
                         if creds:
-                            service = build('calendar', 'v3', credentials=creds)
+                            service = get_calendar_service(creds)
                             calendar = service.calendars().get(calendarId=last_calendar_id).execute()
                             self.calendar_id = last_calendar_id
                             self.user_email = calendar.get('id', 'Unknown')
                             self.service = service
+                            self.credentials = creds
                             calendar_name = calendar.get('summary', self.calendar_id)
                             self.user_label.setText(calendar_name)
                             self.load_events()
@@ -2070,7 +2829,8 @@ class MainWindow(QMainWindow):
         if login_dialog.exec_() == QDialog.Accepted:
             self.calendar_id = login_dialog.calendar_id
             self.user_email = login_dialog.user_email
-            self.service = build('calendar', 'v3', credentials=login_dialog.credentials)
+            self.credentials = login_dialog.credentials
+            self.service = get_calendar_service(self.credentials)
             # Fetch and display calendar name
             try:
                 calendar = self.service.calendars().get(calendarId=self.calendar_id).execute()
@@ -2082,13 +2842,13 @@ class MainWindow(QMainWindow):
             self.refresh_timer.start()
     
     def change_language(self, lang):
-        AppSettings.language = lang
-        settings = QSettings("SEINX", "Calendar")
-        settings.setValue("interface_language", lang)
+        set_language(lang)
+        self._qsettings.setValue("interface_language", lang)
         self.update_ui_text()
         self.update_all_labels_and_buttons()
         self.update_table_headers()
         self.update_date_format()
+        self._retranslate_settings_menu()
         # Notify all dialogs/tables to refresh language
         for widget in self.findChildren(QWidget):
             if hasattr(widget, 'refresh_language'):
@@ -2105,95 +2865,45 @@ class MainWindow(QMainWindow):
         )
     
     def change_speech_language(self, lang):
-        settings = QSettings("SEINX", "Calendar")
-        settings.setValue("speech_language", lang)
+        self._qsettings.setValue("speech_language", lang)
         # Notify all speech widgets about the change
         for widget in self.findChildren(SpeechToTextWidget):
             widget.set_language(lang)
     
     def toggle_auto_submit(self, checked):
-        settings = QSettings("SEINX", "Calendar")
-        settings.setValue("auto_submit", checked)
+        self._qsettings.setValue("auto_submit", checked)
         # Update all speech widgets
         for widget in self.findChildren(SpeechToTextWidget):
             widget.set_auto_submit(checked)
     
     def update_ui_text(self):
         # Update all UI text based on current language
+        # When logged in, user_label already shows the calendar name set at login,
+        # which doesn't depend on the language, so no API round-trip is needed here
         if AppSettings.language == "ja":
             self.setWindowTitle("SEINXカレンダー")
-            self.past_button.setText("過去のイベント")
-            self.today_button.setText("今日のイベント")
-            if hasattr(self, 'user_label'):
-                if self.service:
-                    try:
-                        calendar = self.service.calendars().get(calendarId=self.calendar_id).execute()
-                        calendar_name = calendar.get('summary', self.calendar_id)
-                        self.user_label.setText(calendar_name)
-                    except Exception:
-                        self.user_label.setText(self.calendar_id or "ユーザー")
-                else:
-                    self.user_label.setText("未接続")
+            if hasattr(self, 'user_label') and not self.service:
+                self.user_label.setText("未接続")
         else:
             self.setWindowTitle("SEINX Calendar")
-            self.past_button.setText("Past Events")
-            self.today_button.setText("Today's Events")
-            if hasattr(self, 'user_label'):
-                if self.service:
-                    try:
-                        calendar = self.service.calendars().get(calendarId=self.calendar_id).execute()
-                        calendar_name = calendar.get('summary', self.calendar_id)
-                        self.user_label.setText(calendar_name)
-                    except Exception:
-                        self.user_label.setText(self.calendar_id or "User")
-                else:
-                    self.user_label.setText("Not logged in")
+            if hasattr(self, 'user_label') and not self.service:
+                self.user_label.setText("Not logged in")
     
     def update_all_labels_and_buttons(self):
-        # Recursively update all labels and buttons to match the current language
-        def update_widget_text(widget):
-            if isinstance(widget, QLabel):
-                if AppSettings.language == "ja":
-                    if widget.text() == "過去のイベント":
-                        widget.setText("過去のイベント")
-                    elif widget.text() == "今日のイベント":
-                        widget.setText("今日のイベント")
-                else:
-                    if widget.text() == "過去のイベント":
-                        widget.setText("Past Events")
-                    elif widget.text() == "今日のイベント":
-                        widget.setText("Today's Events")
-            elif isinstance(widget, QPushButton):
-                if AppSettings.language == "ja":
-                    if widget.text() == "イベント追加":
-                        widget.setText("イベント追加")
-                    elif widget.text() == "ログアウト":
-                        widget.setText("ログアウト")
-                else:
-                    if widget.text() == "イベント追加":
-                        widget.setText("Add Event")
-                    elif widget.text() == "ログアウト":
-                        widget.setText("Logout")
-            for child in widget.findChildren(QWidget):
-                update_widget_text(child)
-        update_widget_text(self)
+        # Set the tab buttons' text straight from the translation table
+        self.past_button.setText(tr('past_events'))
+        self.today_button.setText(tr('todays_events'))
     
     def update_table_headers(self):
         # Update table headers for both tables
         if hasattr(self, 'today_table') and hasattr(self, 'past_table'):
-            headers_en = ["Name", "Location", "Start Date", "End Date", "Remarks"]
-            headers_ja = ["名前", "場所", "開始日", "終了日", "備考"]
-            headers = headers_ja if AppSettings.language == "ja" else headers_en
-            self.today_table.setHorizontalHeaderLabels(headers)
-            self.past_table.setHorizontalHeaderLabels(headers)
+            self.today_table.calendar_model.refresh_headers()
+            self.past_table.calendar_model.refresh_headers()
     
     def update_date_format(self):
         # Update date label format
         if hasattr(self, 'date_label'):
-            if AppSettings.language == "ja":
-                self.date_label.setText(self.current_date.strftime("%Y/%m/%d"))
-            else:
-                self.date_label.setText(self.current_date.strftime("%Y-%m-%d"))
+            self.date_label.setText(format_date_label(self.current_date))
     
     def change_theme(self, theme):
         AppSettings.theme = theme
@@ -2201,74 +2911,25 @@ class MainWindow(QMainWindow):
         self.apply_theme()
         # Notify all tables to refresh theme and row backgrounds
         for widget in self.findChildren(CalendarTable):
+            widget.calendar_model.apply_theme()
             widget.viewport().update()
             # Always clear highlight so no row is left with the wrong color
             widget.clear_highlight()
     
     def apply_theme(self):
-        if AppSettings.theme == "dark":
-            self.setStyleSheet("""
-                QMainWindow { background-color: #23272e; color: white; }
-                QWidget { background-color: #2c313a; color: white; }
-                QTabWidget::pane { background-color: #23272e; }
-                QTabBar::tab { background-color: #2c313a; color: white; padding: 8px; }
-                QTabBar::tab:selected { background-color: #3a3f4b; }
-                QTableWidget { background-color: #23272e; alternate-background-color: #2c313a; }
-                QHeaderView::section { background-color: #3a3f4b; color: white; }
-                QPushButton { background-color: #3a3f4b; color: white; border: 1px solid #444a5a; padding: 5px; }
-                QPushButton:hover { background-color: #4f5668; }
-                QDialogButtonBox QPushButton { 
-                    background-color: #3a3f4b; 
-                    color: white; 
-                    border: 1px solid #444a5a; 
-                    padding: 8px 16px; 
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QDialogButtonBox QPushButton:hover { 
-                    background-color: #4f5668; 
-                    border-color: #555a6a;
-                }
-                QDialogButtonBox QPushButton:pressed { 
-                    background-color: #2c313a; 
-                    border-color: #3a3f4b;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow { background-color: white; color: black; }
-                QWidget { background-color: white; color: black; }
-                QTabWidget::pane { background-color: #f0f0f0; }
-                QTabBar::tab { background-color: #e0e0e0; color: black; padding: 8px; }
-                QTabBar::tab:selected { background-color: #d0d0d0; }
-                QTableWidget { background-color: white; alternate-background-color: #f5f5f5; }
-                QHeaderView::section { background-color: #e0e0e0; color: black; }
-                QPushButton { background-color: #e0e0e0; color: black; border: 1px solid #ccc; padding: 5px; }
-                QPushButton:hover { background-color: #d0d0d0; }
-                QDialogButtonBox QPushButton { 
-                    background-color: #e0e0e0; 
-                    color: black; 
-                    border: 1px solid #ccc; 
-                    padding: 8px 16px; 
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QDialogButtonBox QPushButton:hover { 
-                    background-color: #d0d0d0; 
-                    border-color: #adb5bd;
-                }
-                QDialogButtonBox QPushButton:pressed { 
-                    background-color: #c0c0c0; 
-                    border-color: #a0a0a0;
-                }
-            """)
+        qss = MAIN_WINDOW_DARK_QSS if AppSettings.theme == "dark" else MAIN_WINDOW_LIGHT_QSS
+        # Re-applying a stylesheet re-polishes every descendant widget, so skip no-op switches
+        if getattr(self, '_current_qss', None) is qss:
+            return
+        self._current_qss = qss
+        self.setStyleSheet(qss)
     
     def search_by_date(self):
         dialog = DateSearchDialog(self)
         if dialog.exec_() == QDialog.Accepted:
             selected_date = dialog.get_date()
             self.current_date = selected_date
-            self.date_label.setText(selected_date.strftime("%Y-%m-%d"))
+            self.date_label.setText(format_date_label(selected_date))
             self.is_date_specific_view = True  # Set flag for date-specific view
             self.load_events_for_specific_date(selected_date)
             # Show Today button if not today
@@ -2282,8 +2943,8 @@ class MainWindow(QMainWindow):
             # Show message that add event is disabled in date search mode
             QMessageBox.information(
                 self, 
-                tr('add_event'), 
-                tr('add_disabled_in_search')
+                tr_fast('add_event'), 
+                tr_fast('add_disabled_in_search')
             )
             return
         
@@ -2318,11 +2979,11 @@ class MainWindow(QMainWindow):
                 }
             
             event = self.service.events().insert(calendarId=self.calendar_id, body=event).execute()
-            self.show_snackbar(tr('event_created'))
+            self.show_snackbar(tr_fast('event_created'))
             self.force_table_refresh()
             
         except Exception as e:
-            QMessageBox.warning(self, tr('error'), f"{tr('event_failed')} {str(e)}")
+            QMessageBox.warning(self, tr_fast('error'), f"{tr_fast('event_failed')} {str(e)}")
     
     def load_events_for_specific_date(self, target_date):
         """Load events only for the specific date, without past or upcoming events."""
@@ -2373,17 +3034,11 @@ class MainWindow(QMainWindow):
             if current_index == 0:  # Past Events tab
                 self.populate_table(self.past_table, date_events, custom_title=custom_title)
                 # Clear the other table
-                self.today_table.clearContents()
-                self.today_table.clearSpans()
-                self.today_table.setRowCount(0)
-                self.today_table.event_data = {}
+                self.today_table.clear_events()
             else:  # Today's Events tab (index 1)
                 self.populate_table(self.today_table, date_events, custom_title=custom_title)
                 # Clear the other table
-                self.past_table.clearContents()
-                self.past_table.clearSpans()
-                self.past_table.setRowCount(0)
-                self.past_table.event_data = {}
+                self.past_table.clear_events()
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load events for date: {str(e)}")
@@ -2418,8 +3073,8 @@ class MainWindow(QMainWindow):
                     
             else:
                 # Timed event
-                start_dt = datetime.fromisoformat(start_data['dateTime'].replace('Z', '+00:00'))
-                end_dt = datetime.fromisoformat(end_data['dateTime'].replace('Z', '+00:00'))
+                start_dt = parse_event_datetime(start_data['dateTime'])
+                end_dt = parse_event_datetime(end_data['dateTime'])
                 
                 # Convert to local timezone for comparison
                 local_tz = tzlocal.get_localzone()
@@ -2445,6 +3100,10 @@ class MainWindow(QMainWindow):
     def load_events(self):
         if not self.service:
             return
+        if self._events_loading:
+            # Coalesce with the fetch in flight; refresh once more when it lands
+            self._events_reload_pending = True
+            return
         
         try:
             # Get local timezone using tzlocal
@@ -2472,20 +3131,6 @@ class MainWindow(QMainWindow):
                 upcoming_end = upcoming_end_q.toPyDateTime().replace(tzinfo=local_tz)
             upcoming_end_utc = upcoming_end.astimezone(pytz.utc)
             
-            # Fetch all events in the range
-            all_events = self.get_events_with_timerange(
-                today_start_utc.isoformat(), 
-                upcoming_end_utc.isoformat()
-            )
-            
-            # Categorize events without duplication
-            today_events, upcoming_events = self.categorize_events(
-                all_events, today_start, today_end
-            )
-            
-            # Populate today's table with properly categorized events
-            self.populate_table(self.today_table, today_events, upcoming_events)
-            
             # Get past events (last 30 days)
             past_start_q = QDateTime(today_qdate.addDays(-30), QTime(0, 0, 0))
             if hasattr(local_tz, 'localize'):
@@ -2493,200 +3138,106 @@ class MainWindow(QMainWindow):
             else:
                 past_start = past_start_q.toPyDateTime().replace(tzinfo=local_tz)
             past_start_utc = past_start.astimezone(pytz.utc)
-            time_min_past = past_start_utc.isoformat()
-            
-            past_events = self.get_events_with_timerange(time_min_past, today_start_utc.isoformat())
-            self.populate_table(self.past_table, past_events)
             
+            requests = [
+                self.events_request(today_start_utc.isoformat(), upcoming_end_utc.isoformat()),
+                self.events_request(past_start_utc.isoformat(), today_start_utc.isoformat()),
+            ]
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load events: {str(e)}")
+            return
+        
+        # Run the HTTP round-trips on a pool thread; the tables are filled in _on_events_loaded
+        self._today_bounds = (today_start, today_end)
+        # Both ranges go out in a single multipart round-trip
+        worker = EventsWorker(self.service.events(), self.service.new_batch_http_request(), requests,
+                              self.credentials)
+        worker.signals.finished.connect(self._on_events_loaded)
+        worker.signals.error.connect(self._on_events_failed)
+        self._events_worker = worker  # Keep the signals object alive until delivery
+        self._events_loading = True
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_events_loaded(self, results):
+        self._events_loading = False
+        # Skip stale results if the user logged out or switched to a date view meanwhile
+        if self.service and not self.is_date_specific_view:
+            try:
+                all_events, past_events = results
+                today_start, today_end = self._today_bounds
+                
+                # Categorize events without duplication
+                today_events, upcoming_events = self.categorize_events(
+                    all_events, today_start, today_end
+                )
+                
+                # Populate today's table with properly categorized events, skipping unchanged refreshes.
+                # populate_table and clear_events reset the stored signature, so a cleared table always repopulates
+                signature = (events_signature(today_events), events_signature(upcoming_events),
+                             AppSettings.language, AppSettings.theme)
+                if signature != self.today_table.events_signature:
+                    self.populate_table(self.today_table, today_events, upcoming_events)
+                    self.today_table.events_signature = signature
+                
+                signature = (events_signature(past_events), AppSettings.language, AppSettings.theme)
+                if signature != self.past_table.events_signature:
+                    self.populate_table(self.past_table, past_events)
+                    self.past_table.events_signature = signature
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Failed to load events: {str(e)}")
+        self._run_pending_reload()
+    
+    def _on_events_failed(self, message):
+        self._events_loading = False
+        QMessageBox.warning(self, "Error", f"Failed to load events: {message}")
+        self._run_pending_reload()
+    
+    def _run_pending_reload(self):
+        if self._events_reload_pending:
+            self._events_reload_pending = False
+            self.load_events()
     
     def get_events(self, start_time, end_time):
-        events_result = self.service.events().list(
-            calendarId=self.calendar_id,
-            timeMin=start_time.isoformat() + 'Z',
-            timeMax=end_time.isoformat() + 'Z',
-            singleEvents=True,
-            orderBy='startTime',
-            maxResults=2500,  # Get more events
-            showDeleted=False  # Explicitly exclude deleted events
-        ).execute()
-        
-        return events_result.get('items', [])
+        return self.get_events_with_timerange(start_time.isoformat() + 'Z', end_time.isoformat() + 'Z')
     
-    def get_events_with_timerange(self, time_min, time_max):
-        """Get events using pre-formatted timeMin and timeMax strings."""
-        events_result = self.service.events().list(
+    def events_request(self, time_min, time_max):
+        """Build, without sending, the events list request for pre-formatted timeMin and timeMax strings."""
+        return self.service.events().list(
             calendarId=self.calendar_id,
             timeMin=time_min,
             timeMax=time_max,
             singleEvents=True,
             orderBy='startTime',
-            maxResults=2500,  # Get more events
-            showDeleted=False  # Explicitly exclude deleted events
-        ).execute()
-        
-        return events_result.get('items', [])
+            maxResults=2500,  # Largest page the API allows; further pages follow nextPageToken
+            showDeleted=False,  # Explicitly exclude deleted events
+            fields=EVENT_LIST_FIELDS
+        )
     
-    def format_date_with_weekday(self, dt, include_time=True, is_all_day=False):
-        """Format a datetime object to include weekday."""
-        # Get weekday name
-        weekday_map = {0: 'mon', 1: 'tue', 2: 'wed', 3: 'thu', 4: 'fri', 5: 'sat', 6: 'sun'}
-        weekday = dt.weekday()  # 0=Monday, 6=Sunday
-        weekday_key = weekday_map.get(weekday, 'mon')
-        weekday_name = tr(weekday_key)
-        
-        if is_all_day:
-            return f"{dt.strftime('%Y-%m-%d')} ({weekday_name}) ({tr('all_day')})"
-        elif include_time:
-            return f"{dt.strftime('%Y-%m-%d')} ({weekday_name}) {dt.strftime('%H:%M')}"
-        else:
-            return f"{dt.strftime('%Y-%m-%d')} ({weekday_name})"
+    def get_events_with_timerange(self, time_min, time_max):
+        """Get events using pre-formatted timeMin and timeMax strings, following every result page."""
+        events = []
+        request = self.events_request(time_min, time_max)
+        while request is not None:
+            response = request.execute()
+            events.extend(response.get('items', []))
+            request = self.service.events().list_next(request, response)
+        return events
     
     def populate_table(self, table, events, upcoming_events=None, custom_title=None):
         """Populate table with events, ensuring proper row structure."""
-        # Clear the table completely and reset structure
-        table.clearContents()
-        table.clearSpans()  # Clear any merged cells
-        table.event_data = {}  # Clear existing event data
-        
-        # Reset table structure completely
-        table.setRowCount(0)
+        table.events_signature = None  # Set again by load_events for its own payloads
         
         # Only show rows if logged in
         if not self.service:
+            table.clear_events()
             return
         
         # Filter out any deleted events
-        active_events = [event for event in events if not event.get('status') == 'cancelled']
-        upcoming_active = [event for event in upcoming_events if not event.get('status') == 'cancelled'] if upcoming_events else []
-        
-        # Calculate total rows needed
-        total_rows = len(active_events)
-        if custom_title:
-            total_rows += 1  # Add 1 for custom title separator
-        if upcoming_events:
-            # Add 2 for separator (empty row + separator row) and the length of upcoming events
-            total_rows += len(upcoming_active) + 2
-        
-        # Set new row count
-        table.setRowCount(total_rows)
-        
-        current_row = 0
-        
-        # Add custom title separator if provided
-        if custom_title:
-            # Add separator row with custom title
-            separator_item = QTableWidgetItem(custom_title)
-            if AppSettings.theme == 'dark':
-                separator_item.setBackground(QColor("#2c313a"))
-                separator_item.setForeground(QColor("#4a9eff"))
-            else:
-                separator_item.setBackground(QColor("#f8f9fa"))
-                separator_item.setForeground(QColor("#1976d2"))
-            separator_item.setData(Qt.UserRole, 'date_separator')
-            separator_item.setFont(QFont("Arial", 10, QFont.Bold))
-            separator_item.setTextAlignment(Qt.AlignCenter)
-            table.setItem(current_row, 0, separator_item)
-            table.setSpan(current_row, 0, 1, 5)  # Merge all columns for the separator row
-            separator_item.setFlags(separator_item.flags() & ~Qt.ItemIsEditable)
-            current_row += 1
-        
-        # Add main events
-        for event in active_events:
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            end = event['end'].get('dateTime', event['end'].get('date'))
-            
-            # Parse datetime strings
-            if 'T' in start:
-                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                start_str = self.format_date_with_weekday(start_dt, include_time=True, is_all_day=False)
-            else:
-                start_dt = datetime.fromisoformat(start)
-                start_str = self.format_date_with_weekday(start_dt, include_time=False, is_all_day=True)
-            
-            if 'T' in end:
-                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                end_str = self.format_date_with_weekday(end_dt, include_time=True, is_all_day=False)
-            else:
-                end_dt = datetime.fromisoformat(end)
-                end_str = self.format_date_with_weekday(end_dt, include_time=False, is_all_day=True)
-            
-            # Create new items for each cell
-            table.setItem(current_row, 0, QTableWidgetItem(event.get('summary', 'No Title')))
-            table.setItem(current_row, 1, QTableWidgetItem(event.get('location', '')))
-            table.setItem(current_row, 2, QTableWidgetItem(start_str))
-            table.setItem(current_row, 3, QTableWidgetItem(end_str))
-            table.setItem(current_row, 4, QTableWidgetItem(event.get('description', '')))
-            
-            # Store event data for this row
-            table.event_data[current_row] = event
-            current_row += 1
+        def active(items):
+            return [event for event in items if event.get('status') != 'cancelled']
         
-        # If we have upcoming events, add them after a separator
-        if upcoming_events and upcoming_active:
-            # Add empty row before separator (only if we don't have a custom title)
-            if not custom_title:
-                for col in range(5):
-                    empty_item = QTableWidgetItem("")
-                    table.setItem(current_row, col, empty_item)
-                current_row += 1
-            
-            # Add separator row
-            separator_item = QTableWidgetItem(tr('upcoming_events'))
-            if AppSettings.theme == 'dark':
-                separator_item.setBackground(QColor("#333333"))
-                separator_item.setForeground(QColor("#ffffff"))
-            else:
-                separator_item.setBackground(QColor("#f0f0f0"))
-                separator_item.setForeground(QColor("#222222"))
-            separator_item.setData(Qt.UserRole, 'breaker')
-            separator_item.setFont(QFont("Arial", 10, QFont.Bold))
-            separator_item.setTextAlignment(Qt.AlignCenter)
-            table.setItem(current_row, 0, separator_item)
-            table.setSpan(current_row, 0, 1, 5)  # Merge all columns for the separator row
-            separator_item.setFlags(separator_item.flags() & ~Qt.ItemIsEditable)
-            current_row += 1
-            
-            # Add upcoming events
-            for event in upcoming_active:
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                end = event['end'].get('dateTime', event['end'].get('date'))
-                
-                if 'T' in start:
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    start_str = self.format_date_with_weekday(start_dt, include_time=True, is_all_day=False)
-                else:
-                    start_dt = datetime.fromisoformat(start)
-                    start_str = self.format_date_with_weekday(start_dt, include_time=False, is_all_day=True)
-                
-                if 'T' in end:
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    end_str = self.format_date_with_weekday(end_dt, include_time=True, is_all_day=False)
-                else:
-                    end_dt = datetime.fromisoformat(end)
-                    end_str = self.format_date_with_weekday(end_dt, include_time=False, is_all_day=True)
-                
-                table.setItem(current_row, 0, QTableWidgetItem(event.get('summary', 'No Title')))
-                table.setItem(current_row, 1, QTableWidgetItem(event.get('location', '')))
-                table.setItem(current_row, 2, QTableWidgetItem(start_str))
-                table.setItem(current_row, 3, QTableWidgetItem(end_str))
-                table.setItem(current_row, 4, QTableWidgetItem(event.get('description', '')))
-                
-                table.event_data[current_row] = event
-                current_row += 1
-        
-        # Add empty rows for better UX
-        visible_rows = table.viewport().height() // table.rowHeight(0) if table.rowCount() > 0 else 10
-        extra_rows = max(0, visible_rows - table.rowCount())
-        for _ in range(extra_rows):
-            row = table.rowCount()
-            table.insertRow(row)
-            for col in range(table.columnCount()):
-                table.setItem(row, col, QTableWidgetItem(""))
-        
-        # Refresh the table
-        table.viewport().update()
+        # The model swaps in all rows with a single reset
+        table.set_events(active(events), active(upcoming_events or ()), custom_title)
     
     def on_past_button_clicked(self):
         """Handle past button click - reset to normal view if in date-specific mode."""
@@ -2705,7 +3256,7 @@ class MainWindow(QMainWindow):
     
     def reset_to_today(self):
         self.current_date = datetime.now().date()
-        self.date_label.setText(self.current_date.strftime("%Y-%m-%d"))
+        self.date_label.setText(format_date_label(self.current_date))
         self.is_date_specific_view = False  # Clear flag for regular view
         self.load_events()
         self.today_btn.setVisible(False)
@@ -2718,10 +3269,10 @@ class MainWindow(QMainWindow):
         token_manager.clear_credentials()
         
         # Clear stored calendar ID
-        settings = QSettings("SEINX", "Calendar")
-        settings.remove("last_calendar_id")
+        self._qsettings.remove("last_calendar_id")
         
         self.service = None
+        self.credentials = None
         self.user_email = ""
         self.calendar_id = None
         self.user_label.setText("No connected account")
@@ -2731,9 +3282,7 @@ class MainWindow(QMainWindow):
     def clear_tables(self):
         # Clear and hide rows in all tables when logged out
         for table in [self.today_table, self.past_table]:
-            table.clearContents()
-            table.setRowCount(0)  # Set to 0 rows when logged out
-            table.event_data = {}
+            table.clear_events()  # No rows when logged out
     
     def update_event(self, event_data):
         dialog = UpdateEventDialog(event_data, self)
@@ -2748,43 +3297,44 @@ class MainWindow(QMainWindow):
                     'description': updated_data['remarks']
                 }
                 
-                # Handle all-day events differently
+                # Handle all-day events differently. Patch merges start/end into the stored
+                # values, so the unused form is nulled out when switching between the two
                 if updated_data.get('is_all_day'):
-                    event['start'] = {'date': updated_data['start'].strftime('%Y-%m-%d')}
-                    event['end'] = {'date': (updated_data['end'] + timedelta(days=1)).strftime('%Y-%m-%d')}
+                    event['start'] = {'date': updated_data['start'].strftime('%Y-%m-%d'),
+                                      'dateTime': None, 'timeZone': None}
+                    event['end'] = {'date': (updated_data['end'] + timedelta(days=1)).strftime('%Y-%m-%d'),
+                                    'dateTime': None, 'timeZone': None}
                 else:
                     event['start'] = {
+                        'date': None,
                         'dateTime': updated_data['start'].isoformat(),
                         'timeZone': local_tz,
                     }
                     event['end'] = {
+                        'date': None,
                         'dateTime': updated_data['end'].isoformat(),
                         'timeZone': local_tz,
                     }
                 
-                # Preserve any existing fields that we don't update
-                for key in event_data:
-                    if key not in event and key not in ['start', 'end']:
-                        event[key] = event_data[key]
-                
-                self.service.events().update(
+                # Patch sends only the edited fields; the server leaves every other field as it is
+                self.service.events().patch(
                     calendarId=self.calendar_id,
                     eventId=event_data['id'],
                     body=event
                 ).execute()
-                self.show_snackbar(tr('event_update_success'))
+                self.show_snackbar(tr_fast('event_update_success'))
                 
                 # Force an immediate refresh from the server
                 self.force_table_refresh()
                 
             except Exception as e:
-                QMessageBox.warning(self, tr('error'), f"{tr('event_update_failed')} {str(e)}")
+                QMessageBox.warning(self, tr_fast('error'), f"{tr_fast('event_update_failed')} {str(e)}")
     
     def delete_event(self, event_data):
         reply = QMessageBox.question(
             self,
-            tr('delete_event'),
-            tr('delete_confirm'),
+            tr_fast('delete_event'),
+            tr_fast('delete_confirm'),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
@@ -2795,29 +3345,24 @@ class MainWindow(QMainWindow):
                     calendarId=self.calendar_id,
                     eventId=event_data['id']
                 ).execute()
-                self.show_snackbar(tr('event_deleted'))
+                self.show_snackbar(tr_fast('event_deleted'))
                 
                 # Force an immediate refresh from the server
                 self.force_table_refresh()
                 
             except Exception as e:
-                QMessageBox.warning(self, tr('error'), f"{tr('event_failed')} {str(e)}")
+                QMessageBox.warning(self, tr_fast('error'), f"{tr_fast('event_failed')} {str(e)}")
 
     def show_settings_dialog(self):
         dlg = SettingsDialog(self)
         # Set current values
-        if AppSettings.language == "ja":
-            dlg.lang_combo.setCurrentIndex(1)
-        else:
-            dlg.lang_combo.setCurrentIndex(0)
+        codes = list(SettingsDialog.LANGUAGE_CODES.values())
+        dlg.lang_combo.setCurrentIndex(codes.index(AppSettings.language) if AppSettings.language in codes else 0)
         dlg.theme_combo.setCurrentIndex(1 if AppSettings.theme == "dark" else 0)
         if dlg.exec_() == QDialog.Accepted:
             settings = dlg.get_settings()
             # Apply language
-            if settings['language'] == "日本語":
-                self.change_language("ja")
-            else:
-                self.change_language("en")
+            self.change_language(SettingsDialog.LANGUAGE_CODES.get(settings['language'], "en"))
             # Apply theme
             self.change_theme(settings['theme'].lower())
 
@@ -2831,6 +3376,36 @@ class MainWindow(QMainWindow):
                 # Refresh with regular view
                 self.load_events()
     
+    def changeEvent(self, event):
+        # Pause the auto-refresh while minimized and catch up once restored
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._pause_refresh()
+            else:
+                self._resume_refresh()
+        super().changeEvent(event)
+    
+    def hideEvent(self, event):
+        self._pause_refresh()
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.isMinimized():
+            self._resume_refresh()
+    
+    def _pause_refresh(self):
+        if self.refresh_timer.isActive():
+            self.refresh_timer.stop()
+            self._refresh_paused = True
+    
+    def _resume_refresh(self):
+        if self._refresh_paused:
+            self._refresh_paused = False
+            if self.service:
+                self.force_table_refresh()
+                self.refresh_timer.start()
+    
     def show_snackbar(self, message, duration=3000):
         """Show a temporary notification at the bottom of the window."""
         self.snackbar.show_snackbar(message, duration)
@@ -3002,16 +3577,54 @@ TRANSLATIONS = {
         'end_date_out_of_range': '終了日は1900年から10年後までの範囲で入力してください。',
     }
 }
+# Freeze the source tables and intern their strings, so text shared between
+# languages (e.g. 'OK') is stored once
+TRANSLATIONS = {
+    lang: types.MappingProxyType({sys.intern(key): sys.intern(value) for key, value in table.items()})
+    for lang, table in TRANSLATIONS.items()
+}
 
 # Central settings object for language and theme
 class AppSettings:
     language = 'en'
     theme = 'light'
 
+# Flat per-language snapshots covering every known key (missing ones map to the key itself).
+# Keys are interned so lookups with the identifier-like literals callers pass hit on identity.
+ALL_TR_KEYS = frozenset().union(*TRANSLATIONS.values())
+_TR_TABLES = {
+    lang: {key: table.get(key, key) for key in ALL_TR_KEYS}
+    for lang, table in TRANSLATIONS.items()
+}
+_TR_EN = _TR_TABLES['en']
+_TR_JA = _TR_TABLES['ja']
+
+# Translation table and date format for AppSettings.language, swapped by set_language()
+_ACTIVE_TR = _TR_EN
+_ACTIVE_DATE_FMT = _TR_EN['date_format']
+
+def set_language(lang):
+    """Switch the interface language and the translation table tr() reads from."""
+    global _ACTIVE_TR, _ACTIVE_DATE_FMT
+    AppSettings.language = lang
+    _ACTIVE_TR = _TR_TABLES.get(lang, _TR_EN)
+    _ACTIVE_DATE_FMT = _ACTIVE_TR['date_format']
+
+def format_date_label(value):
+    """Format a date for the header label in the active language's date_format."""
+    if _ACTIVE_DATE_FMT == '%Y-%m-%d':
+        # date.isoformat() builds the same text without parsing a format string
+        return value.isoformat()
+    return value.strftime(_ACTIVE_DATE_FMT)
+
 def tr(key, lang=None):
     if lang is None:
-        lang = AppSettings.language
-    return TRANSLATIONS.get(lang, TRANSLATIONS['en']).get(key, key)
+        return _ACTIVE_TR.get(key, key)
+    return _TR_TABLES.get(lang, _TR_EN).get(key, key)
+
+def tr_fast(key):
+    """tr() for a key known to be in ALL_TR_KEYS: a single lookup in the active snapshot."""
+    return _ACTIVE_TR[key]
 
 class Snackbar(QLabel):
     """
@@ -3027,9 +3640,22 @@ class Snackbar(QLabel):
         self.setAlignment(Qt.AlignCenter)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.ToolTip)
         self.setVisible(False)
-        self.anim = QPropertyAnimation(self, b"windowOpacity")
-        self.anim.setEasingCurve(QEasingCurve.InOutQuad)
-        self.anim.finished.connect(self._on_fade_out)
+        # Both fades are configured once; showing or hiding just starts one
+        self._anim_in = QPropertyAnimation(self, b"windowOpacity")
+        self._anim_in.setEasingCurve(QEasingCurve.InOutQuad)
+        self._anim_in.setDuration(250)
+        self._anim_in.setStartValue(0.0)
+        self._anim_in.setEndValue(1.0)
+        self._anim_out = QPropertyAnimation(self, b"windowOpacity")
+        self._anim_out.setEasingCurve(QEasingCurve.InOutQuad)
+        self._anim_out.setDuration(400)
+        self._anim_out.setStartValue(1.0)
+        self._anim_out.setEndValue(0.0)
+        self._anim_out.finished.connect(self._on_fade_out)
+        # Restarted by each message, so a newer message isn't cut short by an older one's timeout
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.fade_out)
         self._is_showing = False
 
     def show_snackbar(self, message, duration=3000):
@@ -3042,54 +3668,71 @@ class Snackbar(QLabel):
             x = (parent.width() - self.width()) // 2
             y = parent.height() - self.height() - 40
             self.move(x, y)
+        self._anim_out.stop()
         self.setWindowOpacity(0.0)
         self.setVisible(True)
-        self.anim.stop()
-        self.anim.setDuration(250)
-        self.anim.setStartValue(0.0)
-        self.anim.setEndValue(1.0)
-        self.anim.start()
-        QTimer.singleShot(duration, self.fade_out)
+        self._anim_in.start()
+        self._hide_timer.start(duration)
         self._is_showing = True
 
     def fade_out(self):
-        self.anim.stop()
-        self.anim.setDuration(400)
-        self.anim.setStartValue(1.0)
-        self.anim.setEndValue(0.0)
-        self.anim.start()
+        self._anim_in.stop()
+        self._anim_out.start()
 
     def _on_fade_out(self):
-        if self.windowOpacity() == 0.0:
-            self.setVisible(False)
-            self._is_showing = False
+        self.setVisible(False)
+        self._is_showing = False
+
+class EnvironmentCheckWorker(QThread):
+    """
+    Runs the startup environment checks off the GUI thread so the window can
+    appear first. Emits the list of missing requirements (empty when all is well).
+    """
+    finished = pyqtSignal(list)
+
+    def run(self):
+        missing = []
+        if not cuda_available():
+            print('Warning: CUDA GPU not detected. Whisper will run on CPU.')
+        try:
+            has_input = False
+            for device in sd.query_devices():
+                if device['max_input_channels'] > 0:
+                    has_input = True
+                    break
+            if not has_input:
+                missing.append('microphone (no input device found)')
+        except Exception:
+            missing.append('microphone (error detecting input device)')
+        self.finished.emit(missing)
+
+def report_missing_dependencies(missing):
+    """Slot for EnvironmentCheckWorker.finished: explain what is missing and quit."""
+    if not missing:
+        return
+    QMessageBox.critical(None, "Missing Dependencies", f"The following are required to run this app:\n- " + "\n- ".join(missing))
+    # Leave the event loop; app.exec_() then returns 1 to sys.exit()
+    QApplication.instance().exit(1)
 
 if __name__ == "__main__":
-    # --- Startup environment checks ---
-    import shutil
-    import torch
-    from PyQt5.QtWidgets import QApplication, QMessageBox
-    import sounddevice as sd
-    missing = []
-    if shutil.which('ffmpeg') is None:
-        missing.append('ffmpeg (required for audio processing)')
-    if not torch.cuda.is_available():
-        print('Warning: CUDA GPU not detected. Whisper will run on CPU.')
-    try:
-        devices = sd.query_devices()
-        if not any(d['max_input_channels'] > 0 for d in devices):
-            missing.append('microphone (no input device found)')
-    except Exception:
-        missing.append('microphone (error detecting input device)')
-    if missing:
-        app = QApplication(sys.argv)
-        QMessageBox.critical(None, "Missing Dependencies", f"The following are required to run this app:\n- " + "\n- ".join(missing))
-        sys.exit(1)
-    # --- Normal app startup ---
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     
-    window = MainWindow()
+    # Put something on screen while MainWindow is being built
+    splash = QSplashScreen(QPixmap('icons/calendar-app-50.png').scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    splash.show()
+    app.processEvents()
+    
+    # Names are appended as they are added; sort the file once on the way out
+    app.aboutToQuit.connect(name_manager.compact)
+    
+    window = MainWindow(progress=splash)
     window.show()
+    splash.finish(window)
+    
+    # --- Startup environment checks, run once the window is up ---
+    env_check = EnvironmentCheckWorker()
+    env_check.finished.connect(report_missing_dependencies)
+    env_check.start()
     
     sys.exit(app.exec_())